@@ -1,26 +1,30 @@
 import streamlit as st
 import requests
-from PIL import Image
-import base64
-import io
 
 st.set_page_config(page_title="Smart Assistant - Image Classifier")
 
+@st.cache_resource
+def get_http_session() -> requests.Session:
+    # Reused across reruns so the connection to the API server stays open
+    return requests.Session()
+
 st.title("🧠 Smart Assistant")
 st.subheader("Upload an image and get predictions from your AI model.")
 
 uploaded_file = st.file_uploader("Choose an image...", type=["jpg", "png", "jpeg"])
 if uploaded_file:
-    image = Image.open(uploaded_file)
-    st.image(image, caption="Uploaded Image", use_column_width=True)
+    st.image(uploaded_file, caption="Uploaded Image", use_column_width=True)
 
-    buffered = io.BytesIO()
-    image.save(buffered, format="PNG")
-    img_str = base64.b64encode(buffered.getvalue()).decode()
+    # The upload is already a compressed JPEG/PNG, so send its bytes as-is
+    raw = uploaded_file.getvalue()
 
     if st.button("🔍 Predict"):
         with st.spinner("Querying model..."):
-            res = requests.post("http://localhost:8000/predict", json={"image_base64": img_str})
+            res = get_http_session().post(
+                "http://localhost:8000/predict",
+                files={"image": (uploaded_file.name, raw, uploaded_file.type)},
+                timeout=30
+            )
             if res.status_code == 200:
                 st.success(f"Prediction: {res.json()['prediction']}")
             else:
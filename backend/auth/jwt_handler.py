@@ -1,33 +1,66 @@
 import jwt
-from datetime import datetime, timedelta
+import hashlib
+import threading
+import time
+from datetime import timedelta
 from typing import Optional, Dict, Any
+from cachetools import TLRUCache
 import os
 
+# Cache of already-verified token payloads, keyed by sha256(token).
+# Entries live for at most 60 seconds and never past the token's own `exp`.
+_PAYLOAD_CACHE_TTL = 60
+
+def _payload_ttu(key: str, payload: Dict[str, Any], now: float) -> float:
+    """Expire cached payloads at the token expiry or after the cache TTL, whichever comes first"""
+    return min(now + _PAYLOAD_CACHE_TTL, payload.get("exp", now))
+
+_payload_cache = TLRUCache(maxsize=10_000, ttu=_payload_ttu, timer=time.time)
+_payload_cache_lock = threading.Lock()
+
+# Shared PyJWT instance so option and algorithm tables are built once per process
+_JWT = jwt.PyJWT()
+
 class JWTHandler:
     SECRET_KEY = os.getenv("JWT_SECRET_KEY", "your-secret-key-here")
     ALGORITHM = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES = 30
 
+    # Signing key and algorithm list are prepared once at import time
+    _KEY_BYTES = SECRET_KEY.encode("utf-8")
+    _ALGS = (ALGORITHM,)
+    _EXPIRE_SECONDS = ACCESS_TOKEN_EXPIRE_MINUTES * 60
+
     @classmethod
     def create_access_token(cls, data: Dict[str, Any], expires_delta: Optional[timedelta] = None):
         """Create a new JWT access token"""
         to_encode = data.copy()
         if expires_delta:
-            expire = datetime.utcnow() + expires_delta
+            expire = int(time.time()) + int(expires_delta.total_seconds())
         else:
-            expire = datetime.utcnow() + timedelta(minutes=cls.ACCESS_TOKEN_EXPIRE_MINUTES)
-        
-        to_encode.update({"exp": expire})
-        encoded_jwt = jwt.encode(to_encode, cls.SECRET_KEY, algorithm=cls.ALGORITHM)
+            expire = int(time.time()) + cls._EXPIRE_SECONDS
+
+        to_encode["exp"] = expire
+        encoded_jwt = _JWT.encode(to_encode, cls._KEY_BYTES, algorithm=cls.ALGORITHM)
         return encoded_jwt
 
     @classmethod
     def decode_access_token(cls, token: str) -> Dict[str, Any]:
-        """Decode a JWT access token"""
-        try:
-            payload = jwt.decode(token, cls.SECRET_KEY, algorithms=[cls.ALGORITHM])
+        """Decode a JWT access token, reusing the cached payload of recently verified tokens"""
+        key = hashlib.sha256(token.encode()).hexdigest()
+        with _payload_cache_lock:
+            payload = _payload_cache.get(key)
+        if payload is not None:
             return payload
+
+        try:
+            payload = _JWT.decode(token, cls._KEY_BYTES, algorithms=cls._ALGS, options={"require": ["exp"]})
         except jwt.ExpiredSignatureError:
             raise Exception("Token has expired")
-        except jwt.JWTError:
-            raise Exception("Invalid token") 
\ No newline at end of file
+        except jwt.InvalidTokenError:
+            raise Exception("Invalid token")
+
+        # Only successfully verified tokens are cached
+        with _payload_cache_lock:
+            _payload_cache[key] = payload
+        return payload
@@ -0,0 +1,74 @@
+"""
+Numba kernel for style_refiner's final polish on ASCII text
+
+Imported optionally; style_refiner falls back to its pure-Python scan when
+numba/numpy are missing or the content isn't ASCII.
+"""
+
+import numpy as np
+from numba import njit
+
+_SPACE = 32
+_PERIOD = 46
+
+
+@njit(cache=True)
+def polish_ascii(buf):
+    """
+    Byte-level twin of style_refiner._polish for an ASCII uint8 buffer
+
+    Returns (out, length): the polished bytes are out[:length]. The output
+    never grows, so out is preallocated at the input size.
+    """
+    out = np.empty(buf.size, np.uint8)
+    n = 0
+    pending_space = False
+    start = True
+    last = 0
+
+    for i in range(buf.size):
+        c = buf[i]
+        if c == _SPACE or 9 <= c <= 13 or 28 <= c <= 31:
+            pending_space = True
+            continue
+        if pending_space:
+            pending_space = False
+            # '.', ',', '!' and '?' swallow the whitespace before them
+            if c != _PERIOD and c != 44 and c != 33 and c != 63:
+                if last != _PERIOD:
+                    out[n] = _SPACE
+                    n += 1
+                    start = False
+                elif n == 1:
+                    n = 0
+                    start = True
+                else:
+                    out[n] = _SPACE
+                    n += 1
+                    start = True
+        if start:
+            if 97 <= c <= 122:
+                c -= 32
+            start = False
+        out[n] = c
+        n += 1
+        last = c
+
+    if pending_space:
+        if last == _PERIOD:
+            n -= 1
+        else:
+            out[n] = _SPACE
+            n += 1
+
+    return out, n
+
+
+def polish(content: str) -> str:
+    """polish_ascii for an ASCII str"""
+    out, length = polish_ascii(np.frombuffer(content.encode('ascii'), dtype=np.uint8))
+    return out[:length].tobytes().decode('ascii')
+
+
+# Compile (or load the on-disk cache) at import so the first request isn't slow
+polish("warm up. ")
@@ -1,19 +1,177 @@
 import os
-import json
+import re
+import functools
+import hashlib
 import logging
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional, List
+from cachetools import TTLCache
 import openai
-from transformers import pipeline, AutoTokenizer, AutoModelForCausalLM
+import httpx
+from transformers import AutoTokenizer, AutoModelForCausalLM
 import torch
+import numpy as np
+import orjson
 from .aws_config import aws_config
+# ONNX Runtime is optional and opt-in (HF_USE_ONNX) - PyTorch inference is used otherwise
+try:
+    import onnxruntime as ort
+    from onnxruntime.quantization import quantize_dynamic as ort_quantize_dynamic, QuantType
+    ONNXRUNTIME_AVAILABLE = True
+except ImportError:
+    ONNXRUNTIME_AVAILABLE = False
+# Intel Extension for PyTorch is optional - will use int8 dynamic quantization on CPU if not available
+try:
+    import intel_extension_for_pytorch as ipex
+    IPEX_AVAILABLE = True
+except ImportError:
+    IPEX_AVAILABLE = False
+# pyahocorasick is optional - will scan keywords one by one if not available
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# The ONNX export has no KV cache, so every sampled token re-runs the whole prefix;
+# serving from it only pays off for short generations, hence opt-in
+USE_ONNX_RUNTIME = os.getenv('HF_USE_ONNX', '').lower() in ("1", "true", "yes")
+ONNX_MODEL_DIR = os.getenv('HF_ONNX_DIR', os.path.join(os.path.dirname(os.path.dirname(__file__)), 'onnx_models'))
+
+# Keyword extraction fallback tables, built once per process
+_WORD_RE = re.compile(r'\b\w+\b')
+_STOP_WORDS = frozenset({'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by'})
+
+# Lightweight request used to measure SageMaker endpoint latency
+SAGEMAKER_PROBE_PAYLOAD = {"prompt": "ping", "max_length": 1, "temperature": 0.7}
+
+# With no healthy endpoint, re-probe after this many seconds, doubling up to the max
+SAGEMAKER_REPROBE_MIN_SECONDS = 30
+SAGEMAKER_REPROBE_MAX_SECONDS = 600
+
+# Texts shorter than this (in characters) are analyzed locally instead of via OpenAI
+CHEAP_TEXT_THRESHOLD = 200
+
+# OpenAI analysis results keyed by sha256(method + text); TTLCache evicts least recently used when full
+_llm_cache = TTLCache(maxsize=50_000, ttl=3600)
+_llm_cache_lock = threading.Lock()
+
+def _llm_cache_key(method: str, text: str) -> bytes:
+    return hashlib.sha256((method + text).encode("utf-8", "surrogatepass")).digest()
+
+def _llm_cache_get(key: bytes) -> Any:
+    with _llm_cache_lock:
+        return _llm_cache.get(key)
+
+def _llm_cache_set(key: bytes, value: Any) -> None:
+    with _llm_cache_lock:
+        _llm_cache[key] = value
+
+# Sentiment fallback vocabulary
+_POSITIVE_WORDS = ('good', 'great', 'excellent', 'amazing', 'wonderful', 'fantastic')
+_NEGATIVE_WORDS = ('bad', 'terrible', 'awful', 'horrible', 'disappointing')
+
+def _build_sentiment_automaton():
+    """Build one Aho-Corasick automaton that finds every sentiment word in a single pass"""
+    automaton = ahocorasick.Automaton()
+    for word in _POSITIVE_WORDS:
+        automaton.add_word(word, (word, 1))
+    for word in _NEGATIVE_WORDS:
+        automaton.add_word(word, (word, -1))
+    automaton.make_automaton()
+    return automaton
+
+_SENTIMENT_AUTOMATON = _build_sentiment_automaton() if AHOCORASICK_AVAILABLE else None
+
+# Number of dummy generations run at load time to trigger kernel compilation
+WARMUP_GENERATIONS = 3
+
+def _build_onnx_session(model_name: str, model) -> "ort.InferenceSession":
+    """Export the model to ONNX once, quantize it to int8 and open an optimized session"""
+    base_name = model_name.replace('/', '_')
+    fp32_path = os.path.join(ONNX_MODEL_DIR, f"{base_name}.onnx")
+    int8_path = os.path.join(ONNX_MODEL_DIR, f"{base_name}.int8.onnx")
+    
+    if not os.path.exists(int8_path):
+        os.makedirs(ONNX_MODEL_DIR, exist_ok=True)
+        model.config.use_cache = False
+        model.eval()
+        dummy = torch.ones(1, 8, dtype=torch.long)
+        torch.onnx.export(
+            model,
+            (dummy,),
+            fp32_path,
+            input_names=["input_ids"],
+            output_names=["logits"],
+            dynamic_axes={"input_ids": {0: "b", 1: "s"}, "logits": {0: "b", 1: "s"}},
+            opset_version=14
+        )
+        ort_quantize_dynamic(fp32_path, int8_path, weight_type=QuantType.QInt8)
+        logger.info(f"Exported ONNX model to {int8_path}")
+    
+    so = ort.SessionOptions()
+    so.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    so.intra_op_num_threads = os.cpu_count() or 1
+    return ort.InferenceSession(int8_path, sess_options=so, providers=["CPUExecutionProvider"])
+
+def _autocast_for(model):
+    """BF16 autocast for CPU models optimized by IPEX; a no-op for every other model"""
+    enabled = model.device.type == 'cpu' and model.dtype == torch.bfloat16
+    return torch.autocast('cpu', dtype=torch.bfloat16, enabled=enabled)
+
+def _build_text_model(model_name: str):
+    """Load, optimize and warm up a text generation model, returning (tokenizer, model)"""
+    tokenizer = AutoTokenizer.from_pretrained(model_name)
+    model = AutoModelForCausalLM.from_pretrained(model_name)
+    if torch.cuda.is_available():
+        # Dynamic quantization is CPU-only; FP16 keeps GPU accuracy on par with FP32
+        model = model.half().to('cuda').eval()
+        # Compile forward (which generate() calls) to fuse kernels and cut Python dispatch
+        model.forward = torch.compile(model.forward, mode="reduce-overhead", fullgraph=False)
+    elif ONNXRUNTIME_AVAILABLE and USE_ONNX_RUNTIME:
+        # Serve from an int8 ONNX Runtime session with full graph optimizations
+        model = _build_onnx_session(model_name, model)
+    elif IPEX_AVAILABLE:
+        # oneDNN fused kernels with BF16 weights
+        model = ipex.optimize(model.eval(), dtype=torch.bfloat16)
+    else:
+        model = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8).eval()
+    
+    # Run a few tiny generations so the first user request doesn't pay kernel compilation costs
+    warmup_ids = tokenizer("warmup", return_tensors="np")["input_ids"].astype(np.int64)
+    for _ in range(WARMUP_GENERATIONS):
+        if isinstance(model, torch.nn.Module):
+            with torch.inference_mode(), _autocast_for(model):
+                model.generate(
+                    torch.from_numpy(warmup_ids).to(model.device),
+                    max_new_tokens=1,
+                    pad_token_id=tokenizer.eos_token_id
+                )
+        else:
+            model.run(["logits"], {"input_ids": warmup_ids})
+    
+    return tokenizer, model
+
+# Models are loaded at most once per process and name
+_get_cached_text_model = functools.lru_cache(maxsize=4)(_build_text_model)
+
 class AIModelManager:
     def __init__(self):
         self.openai_client = None
         self.huggingface_models = {}
         self.sagemaker_endpoints = {}
+        self._preferred_endpoint: Optional[str] = None
+        # Background re-probe state: at most one probe in flight, next one not before _next_probe_at
+        self._probe_lock = threading.Lock()
+        self._probe_backoff = SAGEMAKER_REPROBE_MIN_SECONDS
+        self._next_probe_at = 0.0
+        # How often analysis calls were answered locally vs. by OpenAI
+        self.analysis_counts = Counter()
         self._initialize_clients()
     
     def _initialize_clients(self):
@@ -21,8 +179,14 @@ class AIModelManager:
         # Initialize OpenAI client
         openai_api_key = os.getenv('OPENAI_API_KEY')
         if openai_api_key:
-            openai.api_key = openai_api_key
-            self.openai_client = openai
+            # Explicit client with a pooled HTTP transport so connections are reused across calls
+            self.openai_client = openai.OpenAI(
+                api_key=openai_api_key,
+                http_client=httpx.Client(
+                    limits=httpx.Limits(max_connections=50, max_keepalive_connections=25),
+                    timeout=30
+                )
+            )
             logger.info("OpenAI client initialized")
         
         # Initialize Hugging Face models
@@ -34,13 +198,10 @@ class AIModelManager:
     def _load_huggingface_models(self):
         """Load Hugging Face models for local inference"""
         try:
-            # Load text generation model
+            # Load text generation model (shared by every manager in this process)
             model_name = os.getenv('HF_MODEL_NAME', 'gpt2')
-            self.huggingface_models['text_generation'] = pipeline(
-                'text-generation',
-                model=model_name,
-                device=0 if torch.cuda.is_available() else -1
-            )
+            tokenizer, model = _get_cached_text_model(model_name)
+            self.huggingface_models['text_generation'] = (tokenizer, model)
             logger.info(f"Loaded Hugging Face model: {model_name}")
         except Exception as e:
             logger.warning(f"Failed to load Hugging Face models: {str(e)}")
@@ -52,9 +213,54 @@ class AIModelManager:
             for endpoint in endpoints:
                 self.sagemaker_endpoints[endpoint['EndpointName']] = endpoint
             logger.info(f"Loaded {len(self.sagemaker_endpoints)} SageMaker endpoints")
+            self._rank_sagemaker_endpoints()
         except Exception as e:
             logger.warning(f"Failed to load SageMaker endpoints: {str(e)}")
     
+    def _probe_sagemaker_endpoint(self, endpoint_name: str) -> Optional[float]:
+        """Return the latency of a tiny request to the endpoint, or None if it failed"""
+        try:
+            start = time.perf_counter()
+            response = aws_config.invoke_sagemaker_endpoint(endpoint_name, SAGEMAKER_PROBE_PAYLOAD)
+            if response is None:
+                return None
+            return time.perf_counter() - start
+        except Exception as e:
+            logger.warning(f"SageMaker endpoint {endpoint_name} probe failed: {str(e)}")
+            return None
+    
+    def _rank_sagemaker_endpoints(self):
+        """Probe all SageMaker endpoints concurrently and prefer the fastest healthy one"""
+        names = list(self.sagemaker_endpoints)
+        if not names:
+            self._preferred_endpoint = None
+            return
+        
+        with ThreadPoolExecutor(max_workers=min(8, len(names))) as pool:
+            latencies = dict(zip(names, pool.map(self._probe_sagemaker_endpoint, names)))
+        
+        healthy = {name: latency for name, latency in latencies.items() if latency is not None}
+        self._preferred_endpoint = min(healthy, key=healthy.get) if healthy else None
+        if healthy:
+            self._probe_backoff = SAGEMAKER_REPROBE_MIN_SECONDS
+        else:
+            self._next_probe_at = time.monotonic() + self._probe_backoff
+            self._probe_backoff = min(self._probe_backoff * 2, SAGEMAKER_REPROBE_MAX_SECONDS)
+        logger.info(f"Preferred SageMaker endpoint: {self._preferred_endpoint}")
+    
+    def _reprobe_sagemaker_endpoints(self):
+        """Re-rank the endpoints in a background thread unless a probe is already running"""
+        if not self._probe_lock.acquire(blocking=False):
+            return
+        
+        def run():
+            try:
+                self._rank_sagemaker_endpoints()
+            finally:
+                self._probe_lock.release()
+        
+        threading.Thread(target=run, daemon=True).start()
+    
     def generate_text_openai(self, prompt: str, model: str = "gpt-3.5-turbo", max_tokens: int = 1000) -> Optional[str]:
         """Generate text using OpenAI API"""
         if not self.openai_client:
@@ -62,7 +268,7 @@ class AIModelManager:
             return None
         
         try:
-            response = self.openai_client.ChatCompletion.create(
+            response = self.openai_client.chat.completions.create(
                 model=model,
                 messages=[
                     {"role": "system", "content": "You are a helpful AI assistant that generates high-quality content."},
@@ -83,18 +289,44 @@ class AIModelManager:
             return None
         
         try:
-            result = self.huggingface_models['text_generation'](
-                prompt,
-                max_length=max_length,
-                num_return_sequences=1,
-                temperature=0.7,
-                do_sample=True
-            )
-            return result[0]['generated_text']
+            tokenizer, model = self.huggingface_models['text_generation']
+            if ONNXRUNTIME_AVAILABLE and isinstance(model, ort.InferenceSession):
+                return self._generate_onnx(tokenizer, model, prompt, max_length)
+            
+            inputs = tokenizer(prompt, return_tensors="pt").to(model.device)
+            with torch.inference_mode(), _autocast_for(model):
+                output_ids = model.generate(
+                    **inputs,
+                    max_length=max_length,
+                    num_return_sequences=1,
+                    temperature=0.7,
+                    do_sample=True,
+                    pad_token_id=tokenizer.eos_token_id
+                )
+            return tokenizer.decode(output_ids[0], skip_special_tokens=True)
         except Exception as e:
             logger.error(f"Hugging Face generation error: {str(e)}")
             return None
     
+    def _generate_onnx(self, tokenizer, session, prompt: str, max_length: int, temperature: float = 0.7) -> str:
+        """Sample tokens from the ONNX Runtime session one step at a time
+        
+        Without a KV cache each step re-runs the full prefix, so cost grows
+        quadratically with max_length.
+        """
+        input_ids = tokenizer(prompt, return_tensors="np")["input_ids"].astype(np.int64)
+        
+        while input_ids.shape[1] < max_length:
+            logits = session.run(["logits"], {"input_ids": input_ids})[0][0, -1, :] / temperature
+            probs = np.exp(logits - logits.max())
+            probs /= probs.sum()
+            next_id = int(np.random.choice(probs.shape[0], p=probs))
+            if next_id == tokenizer.eos_token_id:
+                break
+            input_ids = np.concatenate([input_ids, [[next_id]]], axis=1)
+        
+        return tokenizer.decode(input_ids[0], skip_special_tokens=True)
+    
     def generate_text_sagemaker(self, prompt: str, endpoint_name: str) -> Optional[str]:
         """Generate text using SageMaker endpoint"""
         if endpoint_name not in self.sagemaker_endpoints:
@@ -124,11 +356,17 @@ class AIModelManager:
             if result:
                 return result
         
-        # Try SageMaker endpoints
-        for endpoint_name in self.sagemaker_endpoints:
-            result = self.generate_text_sagemaker(prompt, endpoint_name)
+        # Try the fastest healthy SageMaker endpoint only
+        if self._preferred_endpoint:
+            result = self.generate_text_sagemaker(prompt, self._preferred_endpoint)
             if result:
                 return result
+            # Skip SageMaker until a background re-probe picks a healthy endpoint
+            self._preferred_endpoint = None
+            self._reprobe_sagemaker_endpoints()
+        elif self.sagemaker_endpoints and time.monotonic() >= self._next_probe_at:
+            # The last probe found nothing healthy; try again once its backoff has passed
+            self._reprobe_sagemaker_endpoints()
         
         # Fallback to Hugging Face
         if self.huggingface_models:
@@ -139,12 +377,17 @@ class AIModelManager:
         logger.error("No AI models available for text generation")
         return None
     
-    def analyze_sentiment(self, text: str) -> Dict[str, Any]:
+    def analyze_sentiment(self, text: str, cheap_only: bool = False) -> Dict[str, Any]:
         """Analyze sentiment of text"""
         try:
-            # Use OpenAI for sentiment analysis if available
-            if self.openai_client:
-                response = self.openai_client.ChatCompletion.create(
+            # Short texts (or latency-sensitive callers) skip the OpenAI round-trip
+            if self.openai_client and not cheap_only and len(text) >= CHEAP_TEXT_THRESHOLD:
+                key = _llm_cache_key("analyze_sentiment", text)
+                cached = _llm_cache_get(key)
+                if cached is not None:
+                    return cached
+                self.analysis_counts["sentiment_openai"] += 1
+                response = self.openai_client.chat.completions.create(
                     model="gpt-3.5-turbo",
                     messages=[
                         {"role": "system", "content": "Analyze the sentiment of the following text and return a JSON with 'sentiment' (positive/negative/neutral) and 'confidence' (0-1)."},
@@ -152,33 +395,46 @@ class AIModelManager:
                     ],
                     max_tokens=100
                 )
-                return json.loads(response.choices[0].message.content)
-            
-            # Fallback to simple keyword-based analysis
-            positive_words = ['good', 'great', 'excellent', 'amazing', 'wonderful', 'fantastic']
-            negative_words = ['bad', 'terrible', 'awful', 'horrible', 'disappointing']
-            
-            text_lower = text.lower()
-            positive_count = sum(1 for word in positive_words if word in text_lower)
-            negative_count = sum(1 for word in negative_words if word in text_lower)
+                result = orjson.loads(response.choices[0].message.content)
+                _llm_cache_set(key, result)
+                return result
             
-            if positive_count > negative_count:
-                return {"sentiment": "positive", "confidence": 0.7}
-            elif negative_count > positive_count:
-                return {"sentiment": "negative", "confidence": 0.7}
-            else:
-                return {"sentiment": "neutral", "confidence": 0.5}
+            self.analysis_counts["sentiment_local"] += 1
+            return self._local_sentiment(text)
                 
         except Exception as e:
             logger.error(f"Sentiment analysis error: {str(e)}")
             return {"sentiment": "neutral", "confidence": 0.5}
     
-    def extract_keywords(self, text: str) -> List[str]:
+    def _local_sentiment(self, text: str) -> Dict[str, Any]:
+        """Simple keyword-based sentiment analysis"""
+        text_lower = text.lower()
+        if _SENTIMENT_AUTOMATON is not None:
+            # Each distinct word counts once, matching the per-word presence check below
+            matched = {hit for _, hit in _SENTIMENT_AUTOMATON.iter(text_lower)}
+            score = sum(polarity for _, polarity in matched)
+        else:
+            score = (sum(1 for word in _POSITIVE_WORDS if word in text_lower)
+                     - sum(1 for word in _NEGATIVE_WORDS if word in text_lower))
+        
+        if score > 0:
+            return {"sentiment": "positive", "confidence": 0.7}
+        elif score < 0:
+            return {"sentiment": "negative", "confidence": 0.7}
+        else:
+            return {"sentiment": "neutral", "confidence": 0.5}
+    
+    def extract_keywords(self, text: str, cheap_only: bool = False) -> List[str]:
         """Extract keywords from text"""
         try:
-            # Use OpenAI for keyword extraction if available
-            if self.openai_client:
-                response = self.openai_client.ChatCompletion.create(
+            # Short texts (or latency-sensitive callers) skip the OpenAI round-trip
+            if self.openai_client and not cheap_only and len(text) >= CHEAP_TEXT_THRESHOLD:
+                key = _llm_cache_key("extract_keywords", text)
+                cached = _llm_cache_get(key)
+                if cached is not None:
+                    return cached
+                self.analysis_counts["keywords_openai"] += 1
+                response = self.openai_client.chat.completions.create(
                     model="gpt-3.5-turbo",
                     messages=[
                         {"role": "system", "content": "Extract the most important keywords from the following text and return them as a JSON array."},
@@ -186,25 +442,34 @@ class AIModelManager:
                     ],
                     max_tokens=100
                 )
-                return json.loads(response.choices[0].message.content)
+                result = orjson.loads(response.choices[0].message.content)
+                _llm_cache_set(key, result)
+                return result
             
-            # Fallback to simple keyword extraction
-            import re
-            words = re.findall(r'\b\w+\b', text.lower())
-            # Remove common stop words
-            stop_words = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by'}
-            keywords = [word for word in words if word not in stop_words and len(word) > 3]
-            return list(set(keywords))[:10]
+            self.analysis_counts["keywords_local"] += 1
+            return self._local_keywords(text)
             
         except Exception as e:
             logger.error(f"Keyword extraction error: {str(e)}")
             return []
     
+    def _local_keywords(self, text: str) -> List[str]:
+        """Simple stop-word based keyword extraction"""
+        words = _WORD_RE.findall(text.lower())
+        # Remove common stop words
+        keywords = [word for word in words if len(word) > 3 and word not in _STOP_WORDS]
+        # dict.fromkeys dedups while keeping first-seen order
+        return list(dict.fromkeys(keywords))[:10]
+    
     def summarize_text(self, text: str, max_length: int = 150) -> Optional[str]:
         """Summarize text"""
         try:
             if self.openai_client:
-                response = self.openai_client.ChatCompletion.create(
+                key = _llm_cache_key(f"summarize_text:{max_length}", text)
+                cached = _llm_cache_get(key)
+                if cached is not None:
+                    return cached
+                response = self.openai_client.chat.completions.create(
                     model="gpt-3.5-turbo",
                     messages=[
                         {"role": "system", "content": f"Summarize the following text in {max_length} characters or less:"},
@@ -212,7 +477,9 @@ class AIModelManager:
                     ],
                     max_tokens=max_length
                 )
-                return response.choices[0].message.content
+                summary = response.choices[0].message.content
+                _llm_cache_set(key, summary)
+                return summary
             
             # Fallback to simple summarization
             sentences = text.split('.')
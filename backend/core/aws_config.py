@@ -1,8 +1,10 @@
 import boto3
 import os
+import threading
+from botocore.config import Config
 from botocore.exceptions import ClientError, NoCredentialsError
 from typing import Optional, Dict, Any
-import json
+import orjson
 import logging
 
 # Configure logging
@@ -12,56 +14,58 @@ logger = logging.getLogger(__name__)
 class AWSConfig:
     def __init__(self):
         self.region = os.getenv('AWS_REGION', 'us-east-1')
-        self.sagemaker_client = None
-        self.s3_client = None
-        self.dynamodb_client = None
-        self.lambda_client = None
+        self._session = None
+        self._clients: Dict[str, Any] = {}
+        # boto3 Sessions aren't thread-safe, so client creation from the shared session is serialized
+        self._clients_lock = threading.Lock()
+        self._client_config = Config(max_pool_connections=50)
         self._initialize_clients()
     
     def _initialize_clients(self):
-        """Initialize AWS clients with proper error handling"""
+        """Initialize the shared AWS session; service clients are created lazily on first use"""
         try:
-            # Initialize SageMaker client
-            self.sagemaker_client = boto3.client(
-                'sagemaker',
+            self._session = boto3.Session(
                 region_name=self.region,
                 aws_access_key_id=os.getenv('AWS_ACCESS_KEY_ID'),
                 aws_secret_access_key=os.getenv('AWS_SECRET_ACCESS_KEY')
             )
             
-            # Initialize S3 client
-            self.s3_client = boto3.client(
-                's3',
-                region_name=self.region,
-                aws_access_key_id=os.getenv('AWS_ACCESS_KEY_ID'),
-                aws_secret_access_key=os.getenv('AWS_SECRET_ACCESS_KEY')
-            )
-            
-            # Initialize DynamoDB client
-            self.dynamodb_client = boto3.client(
-                'dynamodb',
-                region_name=self.region,
-                aws_access_key_id=os.getenv('AWS_ACCESS_KEY_ID'),
-                aws_secret_access_key=os.getenv('AWS_SECRET_ACCESS_KEY')
-            )
-            
-            # Initialize Lambda client
-            self.lambda_client = boto3.client(
-                'lambda',
-                region_name=self.region,
-                aws_access_key_id=os.getenv('AWS_ACCESS_KEY_ID'),
-                aws_secret_access_key=os.getenv('AWS_SECRET_ACCESS_KEY')
-            )
-            
-            logger.info("AWS clients initialized successfully")
+            logger.info("AWS session initialized successfully")
             
         except NoCredentialsError:
             logger.error("AWS credentials not found. Please set AWS_ACCESS_KEY_ID and AWS_SECRET_ACCESS_KEY")
             raise
         except Exception as e:
-            logger.error(f"Failed to initialize AWS clients: {str(e)}")
+            logger.error(f"Failed to initialize AWS session: {str(e)}")
             raise
     
+    def _client(self, name: str):
+        """Get a cached client for the given AWS service, creating it on first use"""
+        client = self._clients.get(name)
+        if client is None:
+            with self._clients_lock:
+                client = self._clients.get(name)
+                if client is None:
+                    client = self._session.client(name, config=self._client_config)
+                    self._clients[name] = client
+        return client
+    
+    @property
+    def sagemaker_client(self):
+        return self._client('sagemaker')
+    
+    @property
+    def s3_client(self):
+        return self._client('s3')
+    
+    @property
+    def dynamodb_client(self):
+        return self._client('dynamodb')
+    
+    @property
+    def lambda_client(self):
+        return self._client('lambda')
+    
     def test_connection(self) -> bool:
         """Test AWS connection by making a simple API call"""
         try:
@@ -85,20 +89,13 @@ class AWSConfig:
     def invoke_sagemaker_endpoint(self, endpoint_name: str, payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Invoke a SageMaker endpoint"""
         try:
-            runtime_client = boto3.client(
-                'sagemaker-runtime',
-                region_name=self.region,
-                aws_access_key_id=os.getenv('AWS_ACCESS_KEY_ID'),
-                aws_secret_access_key=os.getenv('AWS_SECRET_ACCESS_KEY')
-            )
-            
-            response = runtime_client.invoke_endpoint(
+            response = self._client('sagemaker-runtime').invoke_endpoint(
                 EndpointName=endpoint_name,
                 ContentType='application/json',
-                Body=json.dumps(payload)
+                Body=orjson.dumps(payload)
             )
             
-            return json.loads(response['Body'].read().decode())
+            return orjson.loads(response['Body'].read())
         except ClientError as e:
             logger.error(f"Failed to invoke SageMaker endpoint {endpoint_name}: {str(e)}")
             return None
@@ -158,10 +155,10 @@ class AWSConfig:
             response = self.lambda_client.invoke(
                 FunctionName=function_name,
                 InvocationType='RequestResponse',
-                Payload=json.dumps(payload)
+                Payload=orjson.dumps(payload)
             )
             
-            return json.loads(response['Payload'].read().decode())
+            return orjson.loads(response['Payload'].read())
         except ClientError as e:
             logger.error(f"Failed to invoke Lambda function {function_name}: {str(e)}")
             return None
@@ -1,9 +1,20 @@
+import asyncio
+import contextlib
+import functools
+import hashlib
 import logging
 import openai
 import os
-from typing import Dict, Any, Optional
-import json
-import requests
+import re
+import string
+import threading
+import time
+from collections import Counter, OrderedDict
+from typing import Dict, Any, List, Optional, AsyncIterator, Tuple
+import httpx
+import numpy as np
+from cachetools import TTLCache
+import orjson
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
@@ -16,7 +27,327 @@ except ImportError as e:
     logger.error(f"❌ Failed to import ollama: {e}")
     ollama = None
 
+# sentence-transformers is optional - semantic response caching is disabled if not available
+try:
+    from sentence_transformers import SentenceTransformer
+    SENTENCE_TRANSFORMERS_AVAILABLE = True
+except ImportError:
+    SENTENCE_TRANSFORMERS_AVAILABLE = False
+
+# With preferred_model="auto" the first HEDGE_PROVIDERS providers are raced. The backup
+# starts once the first has run HEDGE_LATENCY_FACTOR times its usual latency, or
+# HEDGE_DELAY seconds before that latency is known; the rest are tried one by one
+HEDGE_PROVIDERS = int(os.getenv("CONTENT_HEDGE_PROVIDERS", "2"))
+HEDGE_DELAY = float(os.getenv("CONTENT_HEDGE_DELAY", "5"))
+HEDGE_LATENCY_FACTOR = float(os.getenv("CONTENT_HEDGE_LATENCY_FACTOR", "1.5"))
+PROVIDER_TIMEOUT = 30
+GENERATION_BUDGET = 60
+
+# One pooled HTTP/2 client shared by every ContentGenerator
+_http_client: Optional[httpx.AsyncClient] = None
+
+def _shared_http_client() -> httpx.AsyncClient:
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            http2=True,
+            timeout=httpx.Timeout(60.0, connect=5.0),
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50, keepalive_expiry=300)
+        )
+    return _http_client
+
+def _estimate_tokens(text: str) -> int:
+    """Rough token count (~4 characters per token) without splitting the text"""
+    return (len(text) + 3) // 4
+
+# Circuit breaker: a provider that fails BREAKER_THRESHOLD times in a row is skipped for BREAKER_COOLDOWN seconds
+BREAKER_THRESHOLD = 5
+BREAKER_COOLDOWN = 30
+_breaker = {provider: {"fails": 0, "open_until": 0.0} for provider in ("ollama", "openai", "claude", "gemini")}
+
+def _breaker_open(provider: str) -> bool:
+    return time.monotonic() < _breaker[provider]["open_until"]
+
+def _breaker_record(provider: str, success: bool):
+    state = _breaker[provider]
+    if success:
+        state["fails"] = 0
+        return
+    state["fails"] += 1
+    # After the cooldown a single further failure re-opens the breaker
+    if state["fails"] >= BREAKER_THRESHOLD:
+        state["open_until"] = time.monotonic() + BREAKER_COOLDOWN
+        logger.warning(f"⚠️ {provider} failed {state['fails']} times in a row, skipping it for {BREAKER_COOLDOWN}s")
+
+# Moving average of successful call latency per provider, used to time the hedge
+LATENCY_ALPHA = 0.2
+_latency: Dict[str, Optional[float]] = {provider: None for provider in ("ollama", "openai", "claude", "gemini")}
+
+def _latency_record(provider: str, seconds: float):
+    previous = _latency[provider]
+    _latency[provider] = seconds if previous is None else previous + LATENCY_ALPHA * (seconds - previous)
+
+def _hedge_delay(provider: str) -> float:
+    expected = _latency[provider]
+    return HEDGE_DELAY if expected is None else expected * HEDGE_LATENCY_FACTOR
+
+def provider_health() -> Dict[str, Dict[str, Any]]:
+    """Circuit breaker state per provider, for health/metrics endpoints"""
+    return {
+        provider: {"consecutive_failures": state["fails"], "open": _breaker_open(provider)}
+        for provider, state in _breaker.items()
+    }
+
+# With allow_batch=True, generate_multiple_variants sends this many or more OpenAI
+# variants as one Batch API job; a failed or timed-out job falls back to direct calls
+OPENAI_BATCH_THRESHOLD = 8
+OPENAI_BATCH_POLL_INTERVAL = 10
+OPENAI_BATCH_MAX_WAIT = 600
+
+# Per-provider caps on in-flight calls and on tokens per minute (Ollama runs locally and is not rate limited)
+PROVIDER_CONCURRENCY = {"ollama": 4, "openai": 20, "claude": 10, "gemini": 10}
+PROVIDER_TOKENS_PER_MINUTE = {"openai": 90_000, "claude": 40_000, "gemini": 32_000}
+
+# Provider name -> section of ai_config.json
+_CONFIG_KEYS = {"ollama": "ollama", "openai": "openai", "claude": "anthropic", "gemini": "google"}
+
+class TokenBucket:
+    """Async token bucket; acquire() waits until enough budget has refilled"""
+    
+    def __init__(self, rate_per_sec: float, burst: float):
+        self.rate = rate_per_sec
+        self.capacity = burst
+        self._tokens = burst
+        self._updated: Optional[float] = None
+        self._lock: Optional[asyncio.Lock] = None
+    
+    async def acquire(self, amount: float = 1):
+        # A single request larger than the bucket would otherwise wait forever
+        amount = min(amount, self.capacity)
+        loop = asyncio.get_running_loop()
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            while True:
+                now = loop.time()
+                if self._updated is not None:
+                    self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= amount:
+                    self._tokens -= amount
+                    return
+                await asyncio.sleep((amount - self._tokens) / self.rate)
+
+_JSON_HEADERS = {"content-type": "application/json"}
+
+OLLAMA_HOST = "http://localhost:11434"
+# Result of the lazy Ollama health check, shared by every ContentGenerator
+_ollama_ready: Optional[bool] = None
+
+_CONFIG_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "ai_config.json")
+
+@functools.lru_cache(maxsize=1)
+def _load_ai_config(mtime: float) -> Dict[str, Any]:
+    """Parse ai_config.json; keyed on its mtime so edits are picked up without a restart"""
+    with open(_CONFIG_PATH, "rb") as f:
+        return orjson.loads(f.read())
+
+_DEFAULT_CONFIG = {
+    "openai": {"model": "gpt-3.5-turbo", "max_tokens": 2000, "temperature": 0.7},
+    "anthropic": {"model": "claude-3-sonnet-20240229", "max_tokens": 2000},
+    "google": {"model": "gemini-pro", "max_tokens": 2000},
+    "ollama": {"model": "llama3.2:latest", "max_tokens": 2000, "temperature": 0.7},  # Make sure this is here
+    "content_generation": {"default_prompt_template": "Write about {topic}"}
+}
+
+def _current_config() -> Dict[str, Any]:
+    try:
+        return _load_ai_config(os.stat(_CONFIG_PATH).st_mtime)
+    except Exception as e:
+        logger.warning(f"⚠️ Failed to load AI config: {e}")
+        return _DEFAULT_CONFIG
+
+# Parse the config at import so constructors only pay for an os.stat
+_current_config()
+
+# Exact-match provider responses keyed by sha256 of the full request; shared by all ContentGenerator instances
+_exact_cache = TTLCache(maxsize=10_000, ttl=3600)
+exact_cache_stats = Counter()
+
+def _exact_cached(provider: str, config_key: str):
+    """Serve identical deterministic requests to a provider from the exact-match cache"""
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(self, prompt: str, content_type: str, style: str, length: str) -> Dict[str, Any]:
+            if not self._exact_cacheable(config_key):
+                return await func(self, prompt, content_type, style, length)
+            
+            key = self._cache_key(provider, prompt, content_type, style, length)
+            cached = _exact_cache.get(key)
+            if cached is not None:
+                exact_cache_stats["hits"] += 1
+                return dict(cached)
+            
+            exact_cache_stats["misses"] += 1
+            result = await func(self, prompt, content_type, style, length)
+            if result["status"] == "success":
+                _exact_cache[key] = dict(result)
+            return result
+        return wrapper
+    return decorator
+
+# Prompt line prefixes understood by _generate_fallback_content
+_FALLBACK_FIELDS = {
+    "Title": "title",
+    "Description": "description",
+    "Target Audience": "target_audience",
+    "Keywords": "keywords",
+}
+_KW_SPLIT = re.compile(r"\s*,\s*").split
+
+# Fallback Markdown bodies, compiled once and filled in by _generate_fallback_content
+_BLOG_POST_TMPL = string.Template("""# $title
+
+$description
+
+## Introduction
+
+In today's rapidly evolving business landscape, $title_lower has become a cornerstone of modern organizational success. This comprehensive guide explores the key aspects and implications for $audience_lower.
+
+## Key Benefits
+
+The implementation of $title_lower offers numerous advantages:
+
+- **Enhanced Efficiency**: Streamlined processes and automated workflows
+- **Improved Decision Making**: Data-driven insights and analytics
+- **Cost Reduction**: Optimized resource allocation and reduced operational costs
+- **Competitive Advantage**: Staying ahead in an increasingly digital marketplace
+
+## Implementation Strategies
+
+For $audience_lower, successful adoption requires:
+
+1. **Strategic Planning**: Aligning technology with business objectives
+2. **Change Management**: Ensuring smooth organizational transition
+3. **Continuous Learning**: Staying updated with latest developments
+4. **Performance Monitoring**: Tracking key metrics and outcomes
+
+## Future Outlook
+
+As technology continues to advance, $title_lower will play an even more critical role in shaping business success. Organizations that embrace these changes early will be best positioned for long-term growth and sustainability.
+
+## Conclusion
+
+$title represents a fundamental shift in how businesses operate and compete. By understanding and leveraging these technologies, $audience_lower can unlock new opportunities and drive sustainable success.
+
+*Keywords: $keywords*
+""")
+
+_GENERIC_TMPL = string.Template("""# $title
+
+$description
+
+This $content_type explores the critical aspects of $title_lower and its relevance for $audience_lower. Through detailed examination and expert insights, we provide comprehensive coverage of this important topic.
+
+## Key Points
+
+- Understanding the fundamentals of $title_lower
+- Identifying opportunities for $audience_lower
+- Implementing effective strategies and solutions
+- Measuring success and optimizing performance
+
+## Summary
+
+$title represents a significant opportunity for $audience_lower to enhance their capabilities and achieve competitive advantages. By embracing these developments, organizations can position themselves for long-term success and growth.
+
+*Keywords: $keywords*
+""")
+
+# content_type -> (template, keywords used when the prompt lists none)
+_GENERIC_FALLBACK = (_GENERIC_TMPL, "strategy, implementation, success")
+_FALLBACK_TEMPLATES = {"blog_post": (_BLOG_POST_TMPL, "business, technology, innovation")}
+
+class SemanticCache:
+    """Response cache that matches prompts by embedding similarity
+    
+    Entries are sharded by the generation parameters so a hit only ever
+    returns content generated with the same type, style, length and model.
+    Each shard is an LRU of L2-normalized float32 embeddings with a TTL.
+    """
+    
+    def __init__(self, model_name: str = "all-MiniLM-L6-v2", threshold: float = 0.92,
+                 max_entries: int = 256, ttl: float = 3600):
+        self.model_name = model_name
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._model = None
+        self._lock = threading.Lock()
+        # shard key -> OrderedDict[prompt -> (embedding, response, expires_at)]
+        self._shards: Dict[Tuple, OrderedDict] = {}
+        # shard key -> (prompts, stacked embedding matrix), rebuilt after the shard changes
+        self._matrices: Dict[Tuple, Tuple[list, np.ndarray]] = {}
+    
+    def embed(self, prompt: str) -> np.ndarray:
+        """Embed a prompt; blocking, so call it from a worker thread"""
+        if self._model is None:
+            with self._lock:
+                if self._model is None:
+                    self._model = SentenceTransformer(self.model_name)
+        return self._model.encode(prompt, normalize_embeddings=True).astype(np.float32)
+    
+    def get(self, key: Tuple, embedding: np.ndarray) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            shard = self._shards.get(key)
+            if not shard:
+                return None
+            
+            now = time.time()
+            expired = [prompt for prompt, (_, _, expires_at) in shard.items() if expires_at <= now]
+            for prompt in expired:
+                del shard[prompt]
+            if expired:
+                self._matrices.pop(key, None)
+            if not shard:
+                return None
+            
+            if key not in self._matrices:
+                prompts = list(shard)
+                self._matrices[key] = (prompts, np.stack([shard[p][0] for p in prompts]))
+            prompts, matrix = self._matrices[key]
+            
+            scores = matrix @ embedding
+            best = int(np.argmax(scores))
+            if scores[best] < self.threshold:
+                return None
+            
+            prompt = prompts[best]
+            shard.move_to_end(prompt)
+            return dict(shard[prompt][1])
+    
+    def put(self, key: Tuple, prompt: str, embedding: np.ndarray, response: Dict[str, Any]):
+        with self._lock:
+            shard = self._shards.setdefault(key, OrderedDict())
+            shard[prompt] = (embedding, dict(response), time.time() + self.ttl)
+            shard.move_to_end(prompt)
+            while len(shard) > self.max_entries:
+                shard.popitem(last=False)
+            self._matrices.pop(key, None)
+
 class ContentGenerator:
+    """Multi-provider content generation
+    
+    Construction sets up provider clients and is relatively expensive; use
+    get_content_generator() rather than creating one per request. Methods
+    keep no per-call state on the instance, so one instance can serve
+    concurrent requests.
+    """
+    
+    # Prompt skeletons bound once; call with keyword arguments
+    _USER_TMPL = "Generate a {length} {content_type} in {style} style about: {prompt}".format
+    _SYS_TMPL = "You are a professional {content_type} writer. Write in a {style} style.".format
+    _OPENAI_USER_TMPL = "Write a {length} {content_type} about: {prompt}".format
+
     def __init__(self):
         logger.info("🚀 Initializing ContentGenerator...")
         
@@ -24,14 +355,18 @@ class ContentGenerator:
         self.anthropic_client = None
         self.google_client = None
         self.ollama_client = None
+        self._http = _shared_http_client()
         
         self.config = self._load_config()
+        # Sampling with temperature > 0 is not repeatable, so only cache those responses when forced
+        self.force_exact_cache = os.getenv("CONTENT_CACHE_FORCE", "").lower() in ("1", "true", "yes")
+        self.semantic_cache = SemanticCache() if SENTENCE_TRANSFORMERS_AVAILABLE else None
         
         # Initialize OpenAI
         api_key = os.getenv("OPENAI_API_KEY")
         if api_key:
             try:
-                self.openai_client = openai.OpenAI(api_key=api_key)
+                self.openai_client = openai.AsyncOpenAI(api_key=api_key, http_client=self._http)
                 logger.info("✅ OpenAI initialized successfully")
             except Exception as e:
                 logger.warning(f"⚠️ OpenAI initialization failed: {e}")
@@ -56,57 +391,125 @@ class ContentGenerator:
             except Exception as e:
                 logger.warning(f"⚠️ Google Gemini initialization failed: {e}")
         
-        # Initialize Ollama with better error handling
-        logger.info("🔧 Attempting to initialize Ollama...")
+        # Ollama is probed lazily on first use so startup never waits on it
         if ollama is None:
             logger.warning("⚠️ Ollama package not available")
         else:
+            self.ollama_client = ollama.AsyncClient(host=OLLAMA_HOST)
+        
+        # Provider order is fixed once clients are set up: Ollama first since it's free
+        clients = {
+            "ollama": self.ollama_client,
+            "openai": self.openai_client,
+            "claude": self.anthropic_client,
+            "gemini": self.google_client,
+        }
+        self._fallback_order = [name for name in ("ollama", "openai", "claude", "gemini") if clients[name]]
+        self._providers_by_name = {
+            "ollama": self._generate_with_ollama,
+            "openai": self._generate_with_openai,
+            "claude": self._generate_with_claude,
+            "gemini": self._generate_with_gemini,
+        }
+        self._streams_by_name = {
+            "ollama": self._stream_with_ollama,
+            "openai": self._stream_with_openai,
+            "claude": self._stream_with_claude,
+            "gemini": self._stream_with_gemini,
+        }
+        self._semaphores = {name: asyncio.Semaphore(limit) for name, limit in PROVIDER_CONCURRENCY.items()}
+        self._token_buckets = {
+            name: TokenBucket(tokens_per_minute / 60, tokens_per_minute)
+            for name, tokens_per_minute in PROVIDER_TOKENS_PER_MINUTE.items()
+        }
+        
+        # preferred_model -> provider names, preferred first
+        self._provider_orders = {"auto": self._fallback_order}
+        for name in self._fallback_order:
+            self._provider_orders[name] = [name] + [other for other in self._fallback_order if other != name]
+        
+        logger.info("🏁 ContentGenerator initialization complete")
+
+    def _load_config(self) -> Dict[str, Any]:
+        return _current_config()
+
+    async def reload_config(self):
+        """Pick up edits to ai_config.json without blocking the event loop on disk I/O"""
+        self.config = await asyncio.to_thread(_current_config)
+
+    async def warmup(self):
+        """Open pooled connections to the configured cloud providers ahead of the first request"""
+        hosts = [
+            host for host, client in (
+                ("https://api.openai.com/", self.openai_client),
+                ("https://api.anthropic.com/", self.anthropic_client),
+                ("https://generativelanguage.googleapis.com/", self.google_client),
+            ) if client
+        ]
+        results = await asyncio.gather(*[self._http.head(host) for host in hosts], return_exceptions=True)
+        for host, result in zip(hosts, results):
+            if isinstance(result, Exception):
+                logger.warning("⚠️ Connection warm-up to %s failed: %s", host, result)
+
+    async def aclose(self):
+        """Close the shared HTTP connection pool"""
+        await self._http.aclose()
+
+    async def _ensure_ollama(self) -> bool:
+        """Check once per process whether the Ollama service is up"""
+        global _ollama_ready
+        if _ollama_ready is None:
             try:
-                # Test if Ollama is running
-                response = requests.get("http://localhost:11434/api/tags", timeout=5)
-                if response.status_code == 200:
-                    self.ollama_client = True
-                    models = response.json()
+                response = await self._http.get(f"{OLLAMA_HOST}/api/tags", timeout=2)
+                _ollama_ready = response.status_code == 200
+                if _ollama_ready:
+                    models = orjson.loads(response.content)
                     logger.info("✅ Ollama initialized successfully")
                     logger.info(f"📋 Available models: {[model['name'] for model in models.get('models', [])]}")
                 else:
                     logger.warning(f"⚠️ Ollama not responding (status: {response.status_code})")
-            except requests.exceptions.ConnectionError:
-                logger.warning("⚠️ Ollama service not running on localhost:11434")
+            except httpx.ConnectError:
+                logger.warning(f"⚠️ Ollama service not running on {OLLAMA_HOST}")
+                _ollama_ready = False
             except Exception as e:
                 logger.warning(f"⚠️ Ollama initialization failed: {e}")
-        
-        logger.info("🏁 ContentGenerator initialization complete")
+                _ollama_ready = False
+        return _ollama_ready
 
-    def _load_config(self) -> Dict[str, Any]:
-        try:
-            config_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "ai_config.json")
-            with open(config_path, "r") as f:
-                return json.load(f)
-        except Exception as e:
-            logger.warning(f"⚠️ Failed to load AI config: {e}")
-            return {
-                "openai": {"model": "gpt-3.5-turbo", "max_tokens": 2000, "temperature": 0.7},
-                "anthropic": {"model": "claude-3-sonnet-20240229", "max_tokens": 2000},
-                "google": {"model": "gemini-pro", "max_tokens": 2000},
-                "ollama": {"model": "llama3.2:latest", "max_tokens": 2000, "temperature": 0.7},  # Make sure this is here
-                "content_generation": {"default_prompt_template": "Write about {topic}"}
-            }
+    def _exact_cacheable(self, config_key: str) -> bool:
+        return self.force_exact_cache or self.config.get(config_key, {}).get("temperature") == 0
+
+    def _cache_key(self, provider: str, prompt: str, content_type: str, style: str, length: str) -> str:
+        digest = hashlib.sha256(orjson.dumps(self.config.get(_CONFIG_KEYS[provider], {}), option=orjson.OPT_SORT_KEYS))
+        # Hashed as length-prefixed bytes rather than through orjson, which rejects lone surrogates
+        for field in (provider, prompt, content_type, style, length):
+            data = field.encode("utf-8", "surrogatepass")
+            digest.update(len(data).to_bytes(8, "little"))
+            digest.update(data)
+        return digest.hexdigest()
 
     # Add Ollama generation method
+    @_exact_cached("ollama", "ollama")
     async def _generate_with_ollama(self, prompt: str, content_type: str, style: str, length: str) -> Dict[str, Any]:
         """Generate content using Ollama (local AI)"""
+        if not await self._ensure_ollama():
+            return {
+                "content": "Ollama service is not available",
+                "model_used": "ollama",
+                "tokens_used": 0,
+                "status": "error"
+            }
+        
         try:
-            logger.info(f"🚀 Attempting Ollama generation with model: {self.config['ollama']['model']}")
-            logger.info(f"📝 Prompt: {prompt}")
+            logger.debug("🚀 Attempting Ollama generation with model: %s, prompt: %s", self.config['ollama']['model'], prompt)
             
             # Use the correct Ollama API call
-            response = ollama.chat(
+            response = await self.ollama_client.chat(
                 model=self.config["ollama"]["model"],
                 messages=[
                     {
                         "role": "user",
-                        "content": f"Generate a {length} {content_type} in {style} style about: {prompt}"
+                        "content": self._USER_TMPL(length=length, content_type=content_type, style=style, prompt=prompt)
                     }
                 ],
                 options={
@@ -115,8 +518,7 @@ class ContentGenerator:
                 }
             )
             
-            logger.info(f"✅ Ollama response received: {type(response)}")
-            logger.info(f"📄 Response content: {response}")
+            logger.debug("📄 Ollama response: %s", response)
             
             # Extract content from response
             if 'message' in response and 'content' in response['message']:
@@ -128,16 +530,14 @@ class ContentGenerator:
             return {
                 "content": content,
                 "model_used": f"ollama-{self.config['ollama']['model']}",
-                "tokens_used": len(content.split()),
+                "tokens_used": _estimate_tokens(content),
                 "status": "success"
             }
             
         except Exception as e:
-            logger.error(f"❌ Ollama generation failed: {e}")
-            logger.error(f"🔍 Error type: {type(e)}")
-            logger.error(f"📋 Error details: {str(e)}")
-            import traceback
-            logger.error(f"📚 Full traceback: {traceback.format_exc()}")
+            logger.error("❌ Ollama generation failed: %s: %s", type(e).__name__, e)
+            # Tracebacks are only formatted when debug logging is on
+            logger.debug("📚 Ollama failure traceback", exc_info=True)
             
             return {
                 "content": f"Ollama generation failed: {str(e)}",
@@ -148,14 +548,15 @@ class ContentGenerator:
 
     # Add these missing methods:
 
+    @_exact_cached("openai", "openai")
     async def _generate_with_openai(self, prompt: str, content_type: str, style: str, length: str) -> Dict[str, Any]:
         """Generate content using OpenAI"""
         try:
-            response = self.openai_client.chat.completions.create(
+            response = await self.openai_client.chat.completions.create(
                 model=self.config["openai"]["model"],
                 messages=[
-                    {"role": "system", "content": f"You are a professional {content_type} writer. Write in a {style} style."},
-                    {"role": "user", "content": f"Write a {length} {content_type} about: {prompt}"}
+                    {"role": "system", "content": self._SYS_TMPL(content_type=content_type, style=style)},
+                    {"role": "user", "content": self._OPENAI_USER_TMPL(length=length, content_type=content_type, prompt=prompt)}
                 ],
                 max_tokens=self.config["openai"]["max_tokens"],
                 temperature=self.config["openai"]["temperature"]
@@ -170,7 +571,7 @@ class ContentGenerator:
                 "status": "success"
             }
         except Exception as e:
-            logger.error(f"OpenAI generation failed: {e}")
+            logger.error("OpenAI generation failed: %s", e)
             return {
                 "content": f"OpenAI generation failed: {str(e)}",
                 "model_used": "openai",
@@ -178,6 +579,7 @@ class ContentGenerator:
                 "status": "error"
             }
 
+    @_exact_cached("claude", "anthropic")
     async def _generate_with_claude(self, prompt: str, content_type: str, style: str, length: str) -> Dict[str, Any]:
         """Generate content using Claude (Anthropic)"""
         try:
@@ -193,19 +595,19 @@ class ContentGenerator:
                 "messages": [
                     {
                         "role": "user",
-                        "content": f"Generate a {length} {content_type} in {style} style about: {prompt}"
+                        "content": self._USER_TMPL(length=length, content_type=content_type, style=style, prompt=prompt)
                     }
                 ]
             }
             
-            response = requests.post(
+            response = await self._http.post(
                 "https://api.anthropic.com/v1/messages",
                 headers=headers,
-                json=data
+                content=orjson.dumps(data)
             )
             
             if response.status_code == 200:
-                result = response.json()
+                result = orjson.loads(response.content)
                 content = result["content"][0]["text"]
                 return {
                     "content": content,
@@ -217,7 +619,7 @@ class ContentGenerator:
                 raise Exception(f"Claude API error: {response.status_code}")
                 
         except Exception as e:
-            logger.error(f"Claude generation failed: {e}")
+            logger.error("Claude generation failed: %s", e)
             return {
                 "content": f"Claude generation failed: {str(e)}",
                 "model_used": "claude-3",
@@ -225,6 +627,7 @@ class ContentGenerator:
                 "status": "error"
             }
 
+    @_exact_cached("gemini", "google")
     async def _generate_with_gemini(self, prompt: str, content_type: str, style: str, length: str) -> Dict[str, Any]:
         """Generate content using Google Gemini"""
         try:
@@ -233,7 +636,7 @@ class ContentGenerator:
             data = {
                 "contents": [{
                     "parts": [{
-                        "text": f"Generate a {length} {content_type} in {style} style about: {prompt}"
+                        "text": self._USER_TMPL(length=length, content_type=content_type, style=style, prompt=prompt)
                     }]
                 }],
                 "generationConfig": {
@@ -242,13 +645,14 @@ class ContentGenerator:
                 }
             }
             
-            response = requests.post(
+            response = await self._http.post(
                 f"{url}?key={self.google_client}",
-                json=data
+                headers=_JSON_HEADERS,
+                content=orjson.dumps(data)
             )
             
             if response.status_code == 200:
-                result = response.json()
+                result = orjson.loads(response.content)
                 content = result["candidates"][0]["content"]["parts"][0]["text"]
                 return {
                     "content": content,
@@ -260,7 +664,7 @@ class ContentGenerator:
                 raise Exception(f"Gemini API error: {response.status_code}")
                 
         except Exception as e:
-            logger.error(f"Gemini generation failed: {e}")
+            logger.error("Gemini generation failed: %s", e)
             return {
                 "content": f"Gemini generation failed: {str(e)}",
                 "model_used": "gemini-pro",
@@ -271,85 +675,29 @@ class ContentGenerator:
     def _generate_fallback_content(self, prompt: str, content_type: str, style: str, length: str) -> str:
         """Generate realistic fallback content when AI models are not available"""
         try:
-            # Extract key information from the prompt
-            lines = prompt.strip().split('\n')
-            title = ""
-            description = ""
-            target_audience = ""
-            keywords = []
+            # Extract key information from the prompt in one pass
+            parsed = {"title": "", "description": "", "target_audience": "", "keywords": ""}
+            for line in prompt.strip().split('\n'):
+                key, sep, value = line.partition(":")
+                field = _FALLBACK_FIELDS.get(key) if sep else None
+                if field:
+                    parsed[field] = value.strip()
             
-            for line in lines:
-                if line.startswith("Title:"):
-                    title = line.replace("Title:", "").strip()
-                elif line.startswith("Description:"):
-                    description = line.replace("Description:", "").strip()
-                elif line.startswith("Target Audience:"):
-                    target_audience = line.replace("Target Audience:", "").strip()
-                elif line.startswith("Keywords:"):
-                    keywords_text = line.replace("Keywords:", "").strip()
-                    if keywords_text != "None":
-                        keywords = [k.strip() for k in keywords_text.split(',')]
+            title = parsed["title"]
+            description = parsed["description"]
+            target_audience = parsed["target_audience"]
+            keywords = _KW_SPLIT(parsed["keywords"]) if parsed["keywords"] not in ("", "None") else []
             
             # Generate realistic content based on the parameters
-            if content_type == "blog_post":
-                content = f"""# {title}
-
-{description}
-
-## Introduction
-
-In today's rapidly evolving business landscape, {title.lower()} has become a cornerstone of modern organizational success. This comprehensive guide explores the key aspects and implications for {target_audience.lower()}.
-
-## Key Benefits
-
-The implementation of {title.lower()} offers numerous advantages:
-
-- **Enhanced Efficiency**: Streamlined processes and automated workflows
-- **Improved Decision Making**: Data-driven insights and analytics
-- **Cost Reduction**: Optimized resource allocation and reduced operational costs
-- **Competitive Advantage**: Staying ahead in an increasingly digital marketplace
-
-## Implementation Strategies
-
-For {target_audience.lower()}, successful adoption requires:
-
-1. **Strategic Planning**: Aligning technology with business objectives
-2. **Change Management**: Ensuring smooth organizational transition
-3. **Continuous Learning**: Staying updated with latest developments
-4. **Performance Monitoring**: Tracking key metrics and outcomes
-
-## Future Outlook
-
-As technology continues to advance, {title.lower()} will play an even more critical role in shaping business success. Organizations that embrace these changes early will be best positioned for long-term growth and sustainability.
-
-## Conclusion
-
-{title} represents a fundamental shift in how businesses operate and compete. By understanding and leveraging these technologies, {target_audience.lower()} can unlock new opportunities and drive sustainable success.
-
-*Keywords: {', '.join(keywords) if keywords else 'business, technology, innovation'}*
-"""
-            else:
-                content = f"""# {title}
-
-{description}
-
-This {content_type} explores the critical aspects of {title.lower()} and its relevance for {target_audience.lower()}. Through detailed examination and expert insights, we provide comprehensive coverage of this important topic.
-
-## Key Points
-
-- Understanding the fundamentals of {title.lower()}
-- Identifying opportunities for {target_audience.lower()}
-- Implementing effective strategies and solutions
-- Measuring success and optimizing performance
-
-## Summary
-
-{title} represents a significant opportunity for {target_audience.lower()} to enhance their capabilities and achieve competitive advantages. By embracing these developments, organizations can position themselves for long-term success and growth.
-
-*Keywords: {', '.join(keywords) if keywords else 'strategy, implementation, success'}*
-"""
-
-            return content
+            fields = {
+                "title": title,
+                "title_lower": title.lower(),
+                "description": description,
+                "audience_lower": target_audience.lower(),
+                "content_type": content_type,
+            }
+            template, default_keywords = _FALLBACK_TEMPLATES.get(content_type, _GENERIC_FALLBACK)
+            return template.substitute(fields, keywords=', '.join(keywords) if keywords else default_keywords)
             
         except Exception as e:
             logger.error(f"Fallback content generation failed: {e}")
@@ -358,45 +706,40 @@ This {content_type} explores the critical aspects of {title.lower()} and its rel
     async def generate_content(self, prompt: str, content_type: str = "article", 
                              style: str = "professional", length: str = "medium",
                              preferred_model: str = "auto") -> Dict[str, Any]:
-        """Generate content using multiple AI models with fallback"""
+        """Generate content, answering near-duplicate prompts from the semantic cache"""
+        if self.semantic_cache is None:
+            return await self._generate_uncached(prompt, content_type, style, length, preferred_model)
         
-        # Try preferred model first
-        if preferred_model != "auto":
-            if preferred_model == "ollama" and self.ollama_client:
-                result = await self._generate_with_ollama(prompt, content_type, style, length)
-                if result["status"] == "success":
-                    return result
-            elif preferred_model == "openai" and self.openai_client:
-                result = await self._generate_with_openai(prompt, content_type, style, length)
-                if result["status"] == "success":
-                    return result
-            elif preferred_model == "claude" and self.anthropic_client:
-                result = await self._generate_with_claude(prompt, content_type, style, length)
-                if result["status"] == "success":
-                    return result
-            elif preferred_model == "gemini" and self.google_client:
-                result = await self._generate_with_gemini(prompt, content_type, style, length)
-                if result["status"] == "success":
-                    return result
+        key = (content_type, style, length, preferred_model)
+        try:
+            embedding = await asyncio.to_thread(self.semantic_cache.embed, prompt)
+        except Exception as e:
+            logger.warning(f"⚠️ Prompt embedding failed, skipping semantic cache: {e}")
+            return await self._generate_uncached(prompt, content_type, style, length, preferred_model)
         
-        # Fallback to available models in order (add Ollama first since it's free!)
-        if self.ollama_client:  # Try Ollama first
-            result = await self._generate_with_ollama(prompt, content_type, style, length)
-            if result["status"] == "success":
-                return result
+        cached = self.semantic_cache.get(key, embedding)
+        if cached is not None:
+            cached["model_used"] += "+cache"
+            return cached
         
-        if self.openai_client:
-            result = await self._generate_with_openai(prompt, content_type, style, length)
-            if result["status"] == "success":
+        result = await self._generate_uncached(prompt, content_type, style, length, preferred_model)
+        # Template fallback output is not worth serving for similar prompts later
+        if result["status"] == "success" and result["model_used"] != "fallback":
+            self.semantic_cache.put(key, prompt, embedding, result)
+        return result
+
+    async def _generate_uncached(self, prompt: str, content_type: str, style: str, length: str,
+                                 preferred_model: str) -> Dict[str, Any]:
+        """Generate content using multiple AI models with fallback"""
+        providers = self._provider_order(preferred_model)
+        # An explicit model is not hedged, so callers asking for a specific provider get it
+        raced = HEDGE_PROVIDERS if preferred_model == "auto" else 1
+        if providers:
+            result = await self._race_providers(providers[:raced], prompt, content_type, style, length)
+            if result is not None:
                 return result
-        
-        if self.anthropic_client:
-            result = await self._generate_with_claude(prompt, content_type, style, length)
-            if result["status"] == "success":
-                return result
-        
-        if self.google_client:
-            result = await self._generate_with_gemini(prompt, content_type, style, length)
+        for name, generate in providers[raced:]:
+            result = await self._run_provider(name, generate, 0, prompt, content_type, style, length)
             if result["status"] == "success":
                 return result
         
@@ -410,28 +753,347 @@ This {content_type} explores the critical aspects of {title.lower()} and its rel
             "status": "success"
         }
 
+    def _provider_order(self, preferred_model: str) -> list:
+        """Available providers as (name, generate) pairs, preferred model first, then Ollama since it's free"""
+        order = self._provider_orders.get(preferred_model, self._fallback_order)
+        return [(name, self._providers_by_name[name]) for name in order if not _breaker_open(name)]
+
+    @contextlib.asynccontextmanager
+    async def _provider_slot(self, name: str, prompt: str):
+        """Hold a concurrency slot and enough rate-limit budget for one call to a provider"""
+        async with self._semaphores[name]:
+            bucket = self._token_buckets.get(name)
+            if bucket:
+                await bucket.acquire(_estimate_tokens(prompt) + self.config[_CONFIG_KEYS[name]]["max_tokens"])
+            yield
+
+    async def _run_provider(self, name: str, generate, delay: float,
+                            prompt: str, content_type: str, style: str, length: str) -> Dict[str, Any]:
+        if delay:
+            await asyncio.sleep(delay)
+        async def limited() -> Dict[str, Any]:
+            async with self._provider_slot(name, prompt):
+                return await generate(prompt, content_type, style, length)
+        
+        started = time.monotonic()
+        try:
+            result = await asyncio.wait_for(limited(), timeout=PROVIDER_TIMEOUT)
+        except asyncio.TimeoutError:
+            logger.warning("⚠️ %s timed out after %ss", name, PROVIDER_TIMEOUT)
+            result = {"content": "", "model_used": name, "tokens_used": 0, "status": "error"}
+        except Exception as e:
+            logger.warning(f"⚠️ {name} generation failed: {e}")
+            result = {"content": "", "model_used": name, "tokens_used": 0, "status": "error"}
+        success = result["status"] == "success"
+        if success:
+            _latency_record(name, time.monotonic() - started)
+        _breaker_record(name, success)
+        return result
+
+    async def _race_providers(self, providers: list, prompt: str, content_type: str,
+                              style: str, length: str) -> Optional[Dict[str, Any]]:
+        """Run providers concurrently and return the first successful result
+        
+        Later providers only start once the first has taken longer than it usually
+        does (hedged requests), so when it answers in time they are never called.
+        """
+        delay = _hedge_delay(providers[0][0])
+        tasks = [
+            asyncio.create_task(self._run_provider(
+                name, generate, delay * min(index, 1), prompt, content_type, style, length
+            ))
+            for index, (name, generate) in enumerate(providers)
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks, timeout=GENERATION_BUDGET):
+                result = await next_done
+                if result["status"] == "success":
+                    return result
+        except asyncio.TimeoutError:
+            logger.warning(f"⚠️ No provider succeeded within {GENERATION_BUDGET}s")
+        finally:
+            for task in tasks:
+                task.cancel()
+        return None
+
+    async def _stream_with_ollama(self, prompt: str, content_type: str, style: str, length: str,
+                                  usage: Dict[str, Any]) -> AsyncIterator[str]:
+        if not await self._ensure_ollama():
+            raise Exception("Ollama service is not available")
+        usage["model_used"] = f"ollama-{self.config['ollama']['model']}"
+        stream = await self.ollama_client.chat(
+            model=self.config["ollama"]["model"],
+            messages=[{"role": "user", "content": self._USER_TMPL(length=length, content_type=content_type, style=style, prompt=prompt)}],
+            options={
+                "temperature": self.config["ollama"]["temperature"],
+                "num_predict": self.config["ollama"]["max_tokens"]
+            },
+            stream=True
+        )
+        async for part in stream:
+            if part.get("done"):
+                usage["tokens_used"] = part.get("prompt_eval_count", 0) + part.get("eval_count", 0)
+            text = part.get("message", {}).get("content")
+            if text:
+                yield text
+
+    async def _stream_with_openai(self, prompt: str, content_type: str, style: str, length: str,
+                                  usage: Dict[str, Any]) -> AsyncIterator[str]:
+        usage["model_used"] = self.config["openai"]["model"]
+        stream = await self.openai_client.chat.completions.create(
+            model=self.config["openai"]["model"],
+            messages=[
+                {"role": "system", "content": self._SYS_TMPL(content_type=content_type, style=style)},
+                {"role": "user", "content": self._OPENAI_USER_TMPL(length=length, content_type=content_type, prompt=prompt)}
+            ],
+            max_tokens=self.config["openai"]["max_tokens"],
+            temperature=self.config["openai"]["temperature"],
+            stream=True,
+            stream_options={"include_usage": True}
+        )
+        async for chunk in stream:
+            # The final chunk carries usage and no choices
+            if chunk.usage:
+                usage["tokens_used"] = chunk.usage.total_tokens
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
+    async def _stream_with_claude(self, prompt: str, content_type: str, style: str, length: str,
+                                  usage: Dict[str, Any]) -> AsyncIterator[str]:
+        usage["model_used"] = "claude-3"
+        headers = {
+            "x-api-key": self.anthropic_client,
+            "content-type": "application/json",
+            "anthropic-version": "2023-06-01"
+        }
+        data = {
+            "model": self.config["anthropic"]["model"],
+            "max_tokens": self.config["anthropic"]["max_tokens"],
+            "messages": [{"role": "user", "content": self._USER_TMPL(length=length, content_type=content_type, style=style, prompt=prompt)}],
+            "stream": True
+        }
+        async with self._http.stream("POST", "https://api.anthropic.com/v1/messages", headers=headers, content=orjson.dumps(data)) as response:
+            if response.status_code != 200:
+                raise Exception(f"Claude API error: {response.status_code}")
+            async for line in response.aiter_lines():
+                if not line.startswith("data: "):
+                    continue
+                event = orjson.loads(line[6:])
+                if event.get("type") == "content_block_delta":
+                    yield event["delta"].get("text", "")
+                elif event.get("type") == "message_delta":
+                    usage["tokens_used"] = event.get("usage", {}).get("output_tokens", 0)
+
+    async def _stream_with_gemini(self, prompt: str, content_type: str, style: str, length: str,
+                                  usage: Dict[str, Any]) -> AsyncIterator[str]:
+        usage["model_used"] = "gemini-pro"
+        url = f"https://generativelanguage.googleapis.com/v1beta/models/{self.config['google']['model']}:streamGenerateContent"
+        data = {
+            "contents": [{"parts": [{"text": self._USER_TMPL(length=length, content_type=content_type, style=style, prompt=prompt)}]}],
+            "generationConfig": {
+                "maxOutputTokens": self.config["google"]["max_tokens"],
+                "temperature": 0.7
+            }
+        }
+        async with self._http.stream("POST", f"{url}?alt=sse&key={self.google_client}",
+                                     headers=_JSON_HEADERS, content=orjson.dumps(data)) as response:
+            if response.status_code != 200:
+                raise Exception(f"Gemini API error: {response.status_code}")
+            async for line in response.aiter_lines():
+                if not line.startswith("data: "):
+                    continue
+                event = orjson.loads(line[6:])
+                usage["tokens_used"] = event.get("usageMetadata", {}).get("totalTokenCount", usage["tokens_used"])
+                for candidate in event.get("candidates", [])[:1]:
+                    for part in candidate.get("content", {}).get("parts", []):
+                        if part.get("text"):
+                            yield part["text"]
+
+    async def generate_content_stream(self, prompt: str, content_type: str = "article",
+                                      style: str = "professional", length: str = "medium") -> AsyncIterator[Dict[str, Any]]:
+        """Stream generated content as it arrives
+        
+        Yields {"content": chunk} events followed by one final event with
+        model_used, tokens_used and status. Providers are tried in the same
+        order as generate_content; one that fails before its first chunk
+        falls through to the next.
+        """
+        for name in self._fallback_order:
+            if _breaker_open(name):
+                continue
+            stream = self._streams_by_name[name]
+            started = False
+            usage = {"model_used": name, "tokens_used": 0}
+            try:
+                async with self._provider_slot(name, prompt):
+                    async for text in stream(prompt, content_type, style, length, usage):
+                        started = True
+                        yield {"content": text}
+                
+                _breaker_record(name, True)
+                yield {"model_used": usage["model_used"], "tokens_used": usage["tokens_used"], "status": "success"}
+                return
+            except Exception as e:
+                logger.error("%s streaming failed: %s", name, e)
+                _breaker_record(name, False)
+                if started:
+                    yield {"model_used": usage["model_used"], "tokens_used": 0, "status": "error"}
+                    return
+        
+        # No streaming provider available: send the complete result as a single chunk
+        result = await self.generate_content(prompt, content_type, style, length)
+        yield {"content": result["content"]}
+        yield {"model_used": result["model_used"], "tokens_used": result["tokens_used"], "status": result["status"]}
+
+    async def _generate_openai_batch(self, prompts: List[str], content_type: str, style: str,
+                                     length: str) -> List[Dict[str, Any]]:
+        """Generate one completion per prompt through the OpenAI Batch API
+        
+        Batch jobs are billed at half price but are asynchronous on OpenAI's
+        side, so this polls until the job finishes or OPENAI_BATCH_MAX_WAIT passes.
+        """
+        model = self.config["openai"]["model"]
+        requests_jsonl = b"\n".join(
+            orjson.dumps({
+                "custom_id": str(index),
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": model,
+                    "messages": [
+                        {"role": "system", "content": self._SYS_TMPL(content_type=content_type, style=style)},
+                        {"role": "user", "content": self._OPENAI_USER_TMPL(length=length, content_type=content_type, prompt=prompt)}
+                    ],
+                    "max_tokens": self.config["openai"]["max_tokens"],
+                    "temperature": self.config["openai"]["temperature"]
+                }
+            })
+            for index, prompt in enumerate(prompts)
+        )
+        
+        batch_file = await self.openai_client.files.create(file=("variants.jsonl", requests_jsonl), purpose="batch")
+        batch = await self.openai_client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        
+        deadline = time.monotonic() + OPENAI_BATCH_MAX_WAIT
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            if time.monotonic() > deadline:
+                await self.openai_client.batches.cancel(batch.id)
+                raise Exception(f"OpenAI batch {batch.id} did not finish within {OPENAI_BATCH_MAX_WAIT}s")
+            await asyncio.sleep(OPENAI_BATCH_POLL_INTERVAL)
+            batch = await self.openai_client.batches.retrieve(batch.id)
+        
+        if batch.status != "completed" or not batch.output_file_id:
+            raise Exception(f"OpenAI batch {batch.id} ended with status {batch.status}")
+        
+        output = await self.openai_client.files.content(batch.output_file_id)
+        records = {}
+        for line in output.content.splitlines():
+            if line:
+                record = orjson.loads(line)
+                records[record["custom_id"]] = record
+        
+        results = []
+        for index in range(len(prompts)):
+            response = (records.get(str(index)) or {}).get("response") or {}
+            if response.get("status_code") == 200:
+                body = response["body"]
+                results.append({
+                    "content": body["choices"][0]["message"]["content"],
+                    "model_used": model,
+                    "tokens_used": body.get("usage", {}).get("total_tokens", 0),
+                    "status": "success"
+                })
+            else:
+                results.append({
+                    "content": "OpenAI batch request failed",
+                    "model_used": "openai",
+                    "tokens_used": 0,
+                    "status": "error"
+                })
+        return results
+
     async def generate_multiple_variants(self, prompt: str, count: int = 3, 
-                                       models: list = None) -> Dict[str, Any]:
-        """Generate multiple content variants using different models"""
+                                       models: list = None, max_concurrency: int = 4,
+                                       allow_batch: bool = False) -> Dict[str, Any]:
+        """Generate multiple content variants using different models
+        
+        allow_batch lets many OpenAI variants go through the Batch API, which is
+        cheaper but can take up to OPENAI_BATCH_MAX_WAIT; only for callers that
+        can wait that long.
+        """
         if models is None:
             models = ["ollama", "openai", "claude", "gemini"]
         
-        variants = []
-        for i, model in enumerate(models[:count]):
-            try:
-                variant = await self.generate_content(
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def generate_variant(model: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.generate_content(
                     prompt=prompt,
                     content_type="variant",
                     style="professional",
                     length="medium",
                     preferred_model=model
                 )
-                variants.append(variant)
-            except Exception as e:
-                logger.warning(f"Failed to generate variant with {model}: {e}")
+        
+        selected_models = models[:count]
+        
+        # Many OpenAI variants go through the (cheaper) Batch API as a single job
+        batched = []
+        if (allow_batch and self.openai_client and not _breaker_open("openai")
+                and selected_models.count("openai") >= OPENAI_BATCH_THRESHOLD):
+            batched = [index for index, model in enumerate(selected_models) if model == "openai"]
+        direct = [index for index, model in enumerate(selected_models) if index not in batched]
+        
+        coros = [generate_variant(selected_models[index]) for index in direct]
+        if batched:
+            coros.append(self._generate_openai_batch([prompt] * len(batched), "variant", "professional", "medium"))
+        gathered = await asyncio.gather(*coros, return_exceptions=True)
+        
+        results = [None] * len(selected_models)
+        for index, result in zip(direct, gathered):
+            results[index] = result
+        if batched:
+            batch_results = gathered[-1]
+            if isinstance(batch_results, Exception):
+                logger.warning(f"OpenAI batch failed, generating its variants directly: {batch_results}")
+                retry = batched
+            else:
+                retry = []
+                for position, index in enumerate(batched):
+                    results[index] = batch_results[position]
+                    if batch_results[position]["status"] != "success":
+                        retry.append(index)
+            if retry:
+                retried = await asyncio.gather(
+                    *(generate_variant(selected_models[index]) for index in retry), return_exceptions=True
+                )
+                for index, result in zip(retry, retried):
+                    results[index] = result
+        
+        variants = []
+        errors = []
+        for model, result in zip(selected_models, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Failed to generate variant with {model}: {result}")
+                errors.append({"model": model, "error": str(result)})
+            elif result["status"] != "success":
+                errors.append({"model": model, "error": result["content"]})
+            else:
+                variants.append(result)
         
         return {
             "variants": variants,
             "total_variants": len(variants),
+            "errors": errors,
             "status": "success" if variants else "error"
-        } 
\ No newline at end of file
+        }
+
+@functools.lru_cache(maxsize=1)
+def get_content_generator() -> ContentGenerator:
+    """Process-wide shared ContentGenerator"""
+    return ContentGenerator()
\ No newline at end of file
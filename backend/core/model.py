@@ -1,5 +1,5 @@
 # Stub for model prediction logic
 
-def predict_image(image_base64: str) -> str:
-    # TODO: Convert base64 → image → preprocess → model.predict → label
+def predict_image(image_bytes: bytes) -> str:
+    # TODO: Decode image bytes → preprocess → model.predict → label
     return "class_X (mocked)"
@@ -1,47 +1,247 @@
 import asyncio
+import hashlib
 import logging
 import re
-from typing import List, Dict, Tuple
+import threading
+from functools import lru_cache
+from itertools import islice
+from typing import List, Dict, Optional, Tuple
 from collections import Counter
-import requests
 from urllib.parse import urlparse
+from cachetools import LRUCache
+# pyahocorasick is optional - keywords are tallied with a regex alternation if not available
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+# NumPy is optional - needed for score_batch and the Numba kernel
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+# Numba is optional - used for keyword tallies on long texts when pyahocorasick is missing
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = NUMPY_AVAILABLE
+except ImportError:
+    NUMBA_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# Patterns used by the evaluators and optimizers, compiled once at import
+_H1_HTML = re.compile(r'<h1[^>]*>(.*?)</h1>', re.IGNORECASE)
+_H1_MD = re.compile(r'^#\s+(.+)$', re.MULTILINE)
+_H2_HTML = re.compile(r'<h2[^>]*>', re.IGNORECASE)
+_H2_MD = re.compile(r'^##\s+', re.MULTILINE)
+_HEADING_ANY = re.compile(r'<h([123])[^>]*>', re.IGNORECASE)
+_META_DESC_FULL = re.compile(r'<meta[^>]*name=["\']description["\'][^>]*content=["\']([^"\']*)["\']', re.IGNORECASE)
+_META_DESC_PROBE = re.compile(r'<meta[^>]*name=["\']description["\']', re.IGNORECASE)
+_LINK_HREF = re.compile(r'<a[^>]*href=["\']([^"\']*)["\'][^>]*>')
+# Every get_suggestions probe in one scan: `^` only anchors at the start of the
+# content, and links stay case-sensitive as in _LINK_HREF
+_SUGGEST_PROBE = re.compile(
+    r'(?P<h1><h1[^>]*>|^#\s+)'
+    r'|(?P<h2><h2[^>]*>|^##\s+)'
+    r'|(?P<meta><meta[^>]*name=["\']description["\'])'
+    r'|(?P<link>(?-i:<a[^>]*href=["\'][^"\']*["\']))',
+    re.IGNORECASE
+)
+# What the title, heading and meta optimizers look for, in one scan with their own
+# semantics; a match found up front survives the later insertions, so that helper
+# can be skipped (a miss just lets the helper run its own check)
+_OPTIMIZE_PROBE = re.compile(
+    r'(?P<h1>(?i:<h1[^>]*>.*?</h1>)|^#\s+.+$)'
+    r'|(?P<h2>(?i:<h2[^>]*>)|^##\s+)'
+    r'|(?P<meta>(?i:<meta[^>]*name=["\']description["\']))',
+    re.MULTILINE
+)
+_NUM_DOT = re.compile(r'(\d+\.\s+)')
+_CONCLUSION = re.compile(r'conclusion|summary|final', re.IGNORECASE)
+
+@lru_cache(maxsize=32)
+def _tokenize(content: str) -> Tuple[int, Counter]:
+    """Word count and lowercase word frequencies of a text
+    
+    Shared by the density, length and keyword-usage passes, which see the same
+    text several times per optimize() call. The Counter is shared - do not mutate it.
+    """
+    words = content.lower().split()
+    return len(words), Counter(words)
+
+@lru_cache(maxsize=32)
+def _vocabulary(content: str) -> str:
+    """Distinct lowercase words of a text joined by spaces, for one-call substring probes"""
+    return " ".join(_tokenize(content)[1])
+
+def _keyword_word_matches(content: str, keyword_lower: str) -> int:
+    """Exact plus partial (substring) word matches of a lowercase keyword"""
+    # A keyword that is not in any word is not in the joined vocabulary either,
+    # so rare keywords cost one C-level search instead of a scan over every word
+    if keyword_lower not in _vocabulary(content):
+        return 0
+    _, word_counts = _tokenize(content)
+    exact_matches = word_counts.get(keyword_lower, 0)
+    partial_matches = sum(count for word, count in word_counts.items() if keyword_lower in word)
+    return exact_matches + partial_matches
+
+@lru_cache(maxsize=128)
+def _lower_keywords(keywords: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Lowercased keywords, computed once per keyword list instead of in every helper"""
+    return tuple(keyword.lower() for keyword in keywords)
+
+def _overlaps(first: str, second: str) -> bool:
+    """Whether an occurrence of one keyword can share characters with one of the other"""
+    if first in second or second in first:
+        return True
+    shortest = min(len(first), len(second))
+    return any(
+        first.endswith(second[:size]) or second.endswith(first[:size])
+        for size in range(1, shortest)
+    )
+
+@lru_cache(maxsize=128)
+def _keyword_regex(keywords_lower: Tuple[str, ...]):
+    """Alternation of the (sorted, distinct, lowercase) keywords, one named group each
+    
+    Returns None when some keywords can overlap in the text (or one is empty):
+    alternatives consume each other's characters there, so the tally would
+    differ from counting every keyword on its own.
+    """
+    if not keywords_lower or not all(keywords_lower):
+        return None
+    for i, first in enumerate(keywords_lower):
+        if any(_overlaps(first, second) for second in keywords_lower[i + 1:]):
+            return None
+    return re.compile('|'.join(
+        f'(?P<kw{index}>{re.escape(keyword)})' for index, keyword in enumerate(keywords_lower)
+    ))
+
+@lru_cache(maxsize=128)
+def _keyword_automaton(keywords_lower: Tuple[str, ...]):
+    """Aho-Corasick automaton over the (sorted, distinct, lowercase) keywords"""
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords_lower:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+# Below this many bytes of content the regex alternation beats the JIT kernel's setup
+NUMBA_MIN_BYTES = 16_384
+
+if NUMBA_AVAILABLE:
+    # Compiled (or loaded from the on-disk cache) on first call; only reached without pyahocorasick
+    @njit(cache=True)
+    def _count_keywords_kernel(buf, pool, offsets, lengths):
+        """Leftmost non-overlapping occurrences of each keyword in a UTF-8 buffer"""
+        counts = np.zeros(lengths.size, np.int64)
+        next_start = np.zeros(lengths.size, np.int64)
+        size = buf.size
+        for pos in range(size):
+            first = buf[pos]
+            for k in range(lengths.size):
+                length = lengths[k]
+                start = offsets[k]
+                if pos < next_start[k] or pos + length > size or pool[start] != first:
+                    continue
+                matched = True
+                for t in range(1, length):
+                    if buf[pos + t] != pool[start + t]:
+                        matched = False
+                        break
+                if matched:
+                    counts[k] += 1
+                    next_start[k] = pos + length
+        return counts
+    
+    @lru_cache(maxsize=128)
+    def _keyword_arrays(keywords_lower: Tuple[str, ...]):
+        """Keywords packed into one UTF-8 byte pool plus per-keyword offsets and lengths"""
+        encoded = [keyword.encode("utf-8", "surrogatepass") for keyword in keywords_lower]
+        lengths = np.array([len(keyword) for keyword in encoded], dtype=np.int64)
+        offsets = np.zeros(len(encoded), dtype=np.int64)
+        np.cumsum(lengths[:-1], out=offsets[1:])
+        pool = np.frombuffer(b''.join(encoded), dtype=np.uint8)
+        return pool, offsets, lengths
+
+def _keyword_counts(content_lower: str, keywords_lower: List[str]) -> Dict[str, int]:
+    """Non-overlapping occurrences of each keyword, same as str.count per keyword"""
+    distinct = tuple(sorted(set(keywords_lower)))
+    if AHOCORASICK_AVAILABLE and distinct and all(distinct):
+        # The automaton reports every (possibly overlapping) hit in order of end
+        # position; keeping a hit only if it starts after the keyword's previous
+        # kept hit gives the same leftmost non-overlapping count as str.count
+        counts = dict.fromkeys(distinct, 0)
+        last_end = dict.fromkeys(distinct, -1)
+        for end, keyword in _keyword_automaton(distinct).iter(content_lower):
+            if end - len(keyword) >= last_end[keyword]:
+                counts[keyword] += 1
+                last_end[keyword] = end
+        return counts
+    
+    if NUMBA_AVAILABLE and distinct and all(distinct) and len(content_lower) >= NUMBA_MIN_BYTES:
+        # UTF-8 is self-synchronizing, so byte matches line up with str.count's matches
+        buf = np.frombuffer(content_lower.encode("utf-8", "surrogatepass"), dtype=np.uint8)
+        counts = _count_keywords_kernel(buf, *_keyword_arrays(distinct))
+        return dict(zip(distinct, counts.tolist()))
+    
+    pattern = _keyword_regex(distinct)
+    if pattern is None:
+        return {keyword: content_lower.count(keyword) for keyword in distinct}
+    
+    # One scan for all keywords; lastgroup names the keyword that matched
+    counts = dict.fromkeys(distinct, 0)
+    for match in pattern.finditer(content_lower):
+        counts[distinct[int(match.lastgroup[2:])]] += 1
+    return counts
+
+# Scores and suggestion lists remembered per (content, keywords)
+RESULT_CACHE_SIZE = 256
+
+def _result_key(content: str, keywords: List[str]) -> Tuple[bytes, Tuple[str, ...]]:
+    # Keyword order is kept: it decides the order of the density suggestions
+    return hashlib.blake2b(content.encode("utf-8", "surrogatepass"), digest_size=16).digest(), tuple(keywords)
+
 class SEOOptimizer:
     """
     SEO Optimization Agent - Optimizes content for search engines
     """
     
+    # SEO best practices and rules; shared read-only by every instance
+    seo_rules = {
+        "title_length": {"min": 30, "max": 60},
+        "meta_description_length": {"min": 120, "max": 160},
+        "keyword_density": {"min": 0.5, "max": 2.5},  # percentage
+        "heading_structure": ("h1", "h2", "h3"),
+        "content_length": {"min": 300, "max": 2000}
+    }
+    
+    # Common SEO stop words to avoid
+    stop_words = frozenset({
+        "a", "an", "and", "are", "as", "at", "be", "by", "for", "from",
+        "has", "he", "in", "is", "it", "its", "of", "on", "that", "the",
+        "to", "was", "will", "with"
+    })
+    
+    # SEO improvement suggestions
+    improvement_suggestions = {
+        "keyword_density_low": "Increase keyword density by naturally incorporating target keywords",
+        "keyword_density_high": "Reduce keyword stuffing - aim for natural keyword usage",
+        "title_missing": "Add a compelling title with target keywords",
+        "headings_missing": "Add H2 and H3 headings to improve structure",
+        "content_short": "Expand content to provide more value to readers",
+        "meta_missing": "Add meta description for better search results",
+        "links_missing": "Add relevant internal and external links"
+    }
+    
     def __init__(self):
-        # SEO best practices and rules
-        self.seo_rules = {
-            "title_length": {"min": 30, "max": 60},
-            "meta_description_length": {"min": 120, "max": 160},
-            "keyword_density": {"min": 0.5, "max": 2.5},  # percentage
-            "heading_structure": ["h1", "h2", "h3"],
-            "content_length": {"min": 300, "max": 2000}
-        }
-        
-        # Common SEO stop words to avoid
-        self.stop_words = {
-            "a", "an", "and", "are", "as", "at", "be", "by", "for", "from",
-            "has", "he", "in", "is", "it", "its", "of", "on", "that", "the",
-            "to", "was", "will", "with"
-        }
-        
-        # SEO improvement suggestions
-        self.improvement_suggestions = {
-            "keyword_density_low": "Increase keyword density by naturally incorporating target keywords",
-            "keyword_density_high": "Reduce keyword stuffing - aim for natural keyword usage",
-            "title_missing": "Add a compelling title with target keywords",
-            "headings_missing": "Add H2 and H3 headings to improve structure",
-            "content_short": "Expand content to provide more value to readers",
-            "meta_missing": "Add meta description for better search results",
-            "links_missing": "Add relevant internal and external links"
-        }
+        # optimize() runs in worker threads via optimize_async, so the caches are locked
+        self._score_cache = LRUCache(maxsize=RESULT_CACHE_SIZE)
+        self._suggestion_cache = LRUCache(maxsize=RESULT_CACHE_SIZE)
+        self._cache_lock = threading.Lock()
     
-    async def optimize(
+    def optimize(
         self, 
         content: str, 
         keywords: List[str], 
@@ -50,6 +250,8 @@ class SEOOptimizer:
         """
         Optimize content for SEO
         
+        Pure CPU work with no I/O; async callers should use optimize_async.
+        
         Args:
             content: Original content to optimize
             keywords: Target keywords for optimization
@@ -60,23 +262,28 @@ class SEOOptimizer:
         """
         try:
             optimized_content = content
-            changes = []
             
-            # Analyze current content
-            current_density = self._calculate_keyword_density(content, keywords)
-            current_score = self._calculate_seo_score(content, keywords)
+            # Skip the optimizers whose target is already in place
+            present = set()
+            for match in _OPTIMIZE_PROBE.finditer(content):
+                present.add(match.lastgroup)
+                if len(present) == 3:
+                    break
             
             # Optimize title
-            optimized_content = self._optimize_title(optimized_content, keywords)
+            if "h1" not in present:
+                optimized_content = self._optimize_title(optimized_content, keywords)
             
             # Optimize headings
-            optimized_content = self._optimize_headings(optimized_content, keywords)
+            if "h2" not in present:
+                optimized_content = self._optimize_headings(optimized_content, keywords)
             
             # Optimize keyword usage
             optimized_content = self._optimize_keyword_usage(optimized_content, keywords)
             
             # Add meta description
-            optimized_content = self._add_meta_description(optimized_content, keywords)
+            if "meta" not in present:
+                optimized_content = self._add_meta_description(optimized_content, keywords)
             
             # Optimize content structure
             optimized_content = self._optimize_content_structure(optimized_content)
@@ -86,7 +293,7 @@ class SEOOptimizer:
             
             # Recalculate metrics
             final_density = self._calculate_keyword_density(optimized_content, keywords)
-            final_score = self._calculate_seo_score(optimized_content, keywords)
+            final_score = self._calculate_seo_score(optimized_content, keywords, final_density)
             
             return optimized_content, final_density, final_score
             
@@ -94,20 +301,23 @@ class SEOOptimizer:
             logger.error(f"SEO optimization failed: {e}")
             return content, {}, 0.0
     
+    async def optimize_async(
+        self, 
+        content: str, 
+        keywords: List[str], 
+        target_url: str = None
+    ) -> Tuple[str, Dict, float]:
+        """Run optimize() in a worker thread so the regex passes don't block the event loop"""
+        return await asyncio.to_thread(self.optimize, content, keywords, target_url)
+    
     def _calculate_keyword_density(self, content: str, keywords: List[str]) -> Dict:
         """Calculate keyword density for each keyword"""
         density = {}
-        words = content.lower().split()
-        total_words = len(words)
+        total_words, _ = _tokenize(content)
         
-        for keyword in keywords:
-            keyword_lower = keyword.lower()
-            # Count exact matches
-            exact_matches = words.count(keyword_lower)
-            # Count partial matches (keyword as part of other words)
-            partial_matches = sum(1 for word in words if keyword_lower in word)
-            
-            total_matches = exact_matches + partial_matches
+        for keyword, keyword_lower in zip(keywords, _lower_keywords(tuple(keywords))):
+            # Count exact matches plus partial matches (keyword as part of other words)
+            total_matches = _keyword_word_matches(content, keyword_lower)
             density_percentage = (total_matches / total_words) * 100 if total_words > 0 else 0
             
             density[keyword] = {
@@ -118,8 +328,18 @@ class SEOOptimizer:
         
         return density
     
-    def _calculate_seo_score(self, content: str, keywords: List[str]) -> float:
-        """Calculate overall SEO score (0-100)"""
+    def _calculate_seo_score(self, content: str, keywords: List[str], density: Optional[Dict] = None) -> float:
+        """Calculate overall SEO score (0-100), reusing `density` when already computed"""
+        key = _result_key(content, keywords)
+        with self._cache_lock:
+            score = self._score_cache.get(key)
+        if score is None:
+            score = self._compute_seo_score(content, keywords, density)
+            with self._cache_lock:
+                self._score_cache[key] = score
+        return score
+    
+    def _compute_seo_score(self, content: str, keywords: List[str], density: Optional[Dict]) -> float:
         score = 0.0
         max_score = 100.0
         
@@ -128,7 +348,7 @@ class SEOOptimizer:
         score += title_score * 20
         
         # Keyword density (25 points)
-        density_score = self._evaluate_keyword_density(content, keywords)
+        density_score = self._evaluate_keyword_density(content, keywords, density)
         score += density_score * 25
         
         # Content structure (20 points)
@@ -149,11 +369,58 @@ class SEOOptimizer:
         
         return min(score, max_score)
     
+    def score_batch(self, contents: List[str], keywords: List[str]) -> "np.ndarray":
+        """
+        SEO scores (0-100) for many documents sharing one keyword list
+        
+        Keyword densities for all documents go through one (documents x keywords)
+        count matrix; the result matches calling _calculate_seo_score per document.
+        """
+        if not NUMPY_AVAILABLE:
+            raise RuntimeError("score_batch requires numpy")
+        
+        rules = self.seo_rules["keyword_density"]
+        keywords_lower = _lower_keywords(tuple(keywords))
+        documents = len(contents)
+        counts = np.zeros((documents, len(keywords_lower)), dtype=np.int64)
+        totals = np.zeros(documents, dtype=np.int64)
+        title = np.empty(documents)
+        structure = np.empty(documents)
+        length = np.empty(documents)
+        meta = np.empty(documents)
+        links = np.empty(documents)
+        
+        for row, content in enumerate(contents):
+            totals[row], _ = _tokenize(content)
+            for column, keyword_lower in enumerate(keywords_lower):
+                counts[row, column] = _keyword_word_matches(content, keyword_lower)
+            title[row] = self._evaluate_title(content, keywords)
+            structure[row] = self._evaluate_content_structure(content)
+            length[row] = self._evaluate_content_length(content)
+            meta[row] = self._evaluate_meta_description(content)
+            links[row] = self._evaluate_internal_links(content)
+        
+        # Same operation order as the scalar path, so boundary densities compare identically
+        density = np.zeros(counts.shape)
+        np.divide(counts, totals[:, None], out=density, where=totals[:, None] > 0)
+        density *= 100
+        optimal = (density >= rules["min"]) & (density <= rules["max"])
+        density_score = optimal.sum(axis=1) / len(keywords) if keywords else np.zeros(documents)
+        
+        score = np.zeros(documents)
+        score += title * 20
+        score += density_score * 25
+        score += structure * 20
+        score += length * 15
+        score += meta * 10
+        score += links * 10
+        return np.minimum(score, 100.0)
+    
     def _evaluate_title(self, content: str, keywords: List[str]) -> float:
         """Evaluate title optimization"""
-        title_match = re.search(r'<h1[^>]*>(.*?)</h1>', content, re.IGNORECASE)
+        title_match = _H1_HTML.search(content)
         if not title_match:
-            title_match = re.search(r'^#\s+(.+)$', content, re.MULTILINE)
+            title_match = _H1_MD.search(content)
         
         if title_match:
             title = title_match.group(1)
@@ -167,7 +434,7 @@ class SEOOptimizer:
             
             # Check keyword presence
             title_lower = title.lower()
-            keyword_present = any(keyword.lower() in title_lower for keyword in keywords)
+            keyword_present = any(keyword_lower in title_lower for keyword_lower in _lower_keywords(tuple(keywords)))
             if keyword_present:
                 score += 0.5
             
@@ -175,9 +442,10 @@ class SEOOptimizer:
         
         return 0.0
     
-    def _evaluate_keyword_density(self, content: str, keywords: List[str]) -> float:
+    def _evaluate_keyword_density(self, content: str, keywords: List[str], density: Optional[Dict] = None) -> float:
         """Evaluate keyword density"""
-        density = self._calculate_keyword_density(content, keywords)
+        if density is None:
+            density = self._calculate_keyword_density(content, keywords)
         
         optimal_count = 0
         for keyword_data in density.values():
@@ -190,10 +458,13 @@ class SEOOptimizer:
         """Evaluate content structure"""
         score = 0.0
         
-        # Check for headings
-        h1_count = len(re.findall(r'<h1[^>]*>', content, re.IGNORECASE))
-        h2_count = len(re.findall(r'<h2[^>]*>', content, re.IGNORECASE))
-        h3_count = len(re.findall(r'<h3[^>]*>', content, re.IGNORECASE))
+        # Check for headings: one scan, bucketed by level, until all three levels are seen
+        counts = [0, 0, 0, 0]
+        for match in _HEADING_ANY.finditer(content):
+            counts[int(match.group(1))] += 1
+            if all(counts[1:]):
+                break
+        h1_count, h2_count, h3_count = counts[1:]
         
         if h1_count > 0:
             score += 0.3
@@ -206,7 +477,7 @@ class SEOOptimizer:
     
     def _evaluate_content_length(self, content: str) -> float:
         """Evaluate content length"""
-        word_count = len(content.split())
+        word_count, _ = _tokenize(content)
         
         if self.seo_rules["content_length"]["min"] <= word_count <= self.seo_rules["content_length"]["max"]:
             return 1.0
@@ -217,7 +488,7 @@ class SEOOptimizer:
     
     def _evaluate_meta_description(self, content: str) -> float:
         """Evaluate meta description"""
-        meta_match = re.search(r'<meta[^>]*name=["\']description["\'][^>]*content=["\']([^"\']*)["\']', content, re.IGNORECASE)
+        meta_match = _META_DESC_FULL.search(content)
         
         if meta_match:
             meta_length = len(meta_match.group(1))
@@ -230,7 +501,8 @@ class SEOOptimizer:
     
     def _evaluate_internal_links(self, content: str) -> float:
         """Evaluate internal links"""
-        link_count = len(re.findall(r'<a[^>]*href=["\']([^"\']*)["\'][^>]*>', content))
+        # Only 0, 1 or "2 or more" matters, so stop scanning after the second link
+        link_count = sum(1 for _ in islice(_LINK_HREF.finditer(content), 2))
         
         if link_count >= 2:
             return 1.0
@@ -242,9 +514,9 @@ class SEOOptimizer:
     def _optimize_title(self, content: str, keywords: List[str]) -> str:
         """Optimize title with keywords"""
         # Check if title exists
-        title_match = re.search(r'<h1[^>]*>(.*?)</h1>', content, re.IGNORECASE)
+        title_match = _H1_HTML.search(content)
         if not title_match:
-            title_match = re.search(r'^#\s+(.+)$', content, re.MULTILINE)
+            title_match = _H1_MD.search(content)
         
         if not title_match and keywords:
             # Add title if missing
@@ -257,57 +529,64 @@ class SEOOptimizer:
     def _optimize_headings(self, content: str, keywords: List[str]) -> str:
         """Optimize headings with keywords"""
         # Add H2 headings if missing
-        if not re.search(r'<h2[^>]*>', content, re.IGNORECASE) and not re.search(r'^##\s+', content, re.MULTILINE):
+        if not _H2_HTML.search(content) and not _H2_MD.search(content):
             if keywords:
                 primary_keyword = keywords[0]
                 h2_section = f"\n## Why {primary_keyword.title()} Matters\n"
-                # Insert after first paragraph
-                paragraphs = content.split('\n\n')
-                if len(paragraphs) > 1:
-                    paragraphs.insert(1, h2_section)
-                    content = '\n\n'.join(paragraphs)
+                # Insert after first paragraph, splicing at the first blank line
+                cut = content.find('\n\n')
+                if cut != -1:
+                    content = f"{content[:cut + 2]}{h2_section}\n\n{content[cut + 2:]}"
         
         return content
     
     def _optimize_keyword_usage(self, content: str, keywords: List[str]) -> str:
         """Optimize keyword usage throughout content"""
         optimized_content = content
+        keywords_lower = _lower_keywords(tuple(keywords))
+        # Keyword tallies and word count only change when a keyword gets inserted
+        keyword_counts = _keyword_counts(optimized_content.lower(), keywords_lower)
+        total_words, _ = _tokenize(optimized_content)
         
-        for keyword in keywords:
-            keyword_lower = keyword.lower()
-            content_lower = optimized_content.lower()
-            
+        for keyword, keyword_lower in zip(keywords, keywords_lower):
             # Count current usage
-            current_count = content_lower.count(keyword_lower)
-            words = optimized_content.split()
-            total_words = len(words)
+            current_count = keyword_counts[keyword_lower]
             
             # Calculate target usage
             target_density = 1.5  # 1.5% density
             target_count = int((target_density / 100) * total_words)
             
             if current_count < target_count:
-                # Add keyword naturally
-                optimized_content = self._add_keyword_naturally(optimized_content, keyword)
+                # Add keyword naturally; recount only if a sentence was actually extended
+                updated_content = self._add_keyword_naturally(optimized_content, keyword, keyword_lower)
+                if updated_content is not optimized_content:
+                    optimized_content = updated_content
+                    keyword_counts = _keyword_counts(optimized_content.lower(), keywords_lower)
+                    total_words, _ = _tokenize(optimized_content)
         
         return optimized_content
     
-    def _add_keyword_naturally(self, content: str, keyword: str) -> str:
-        """Add keyword naturally to content"""
-        # Find good insertion points (end of sentences)
-        sentences = content.split('. ')
-        
-        for i, sentence in enumerate(sentences):
-            if keyword.lower() not in sentence.lower() and len(sentence) > 20:
+    def _add_keyword_naturally(self, content: str, keyword: str, keyword_lower: Optional[str] = None) -> str:
+        """Add keyword naturally to content, returning `content` itself if no sentence fits"""
+        # Find good insertion points (end of sentences), walking the '. ' boundaries
+        # by index instead of splitting and re-joining the whole text
+        if keyword_lower is None:
+            keyword_lower = keyword.lower()
+        start = 0
+        while True:
+            boundary = content.find('. ', start)
+            end = boundary if boundary != -1 else len(content)
+            # Length check first so short sentences are never sliced or lowercased
+            if end - start > 20 and keyword_lower not in content[start:end].lower():
                 # Add keyword to sentence
-                sentences[i] = f"{sentence} This is particularly important when considering {keyword}."
-                break
-        
-        return '. '.join(sentences)
+                return f"{content[:end]} This is particularly important when considering {keyword}.{content[end:]}"
+            if boundary == -1:
+                return content
+            start = boundary + 2
     
     def _add_meta_description(self, content: str, keywords: List[str]) -> str:
         """Add meta description if missing"""
-        if not re.search(r'<meta[^>]*name=["\']description["\']', content, re.IGNORECASE):
+        if not _META_DESC_PROBE.search(content):
             # Create meta description
             primary_keyword = keywords[0] if keywords else "content"
             meta_desc = f"Learn about {primary_keyword} with our comprehensive guide. Discover best practices, tips, and insights."
@@ -325,10 +604,10 @@ class SEOOptimizer:
         # Add bullet points for better structure
         if 'Key Points' in content or 'Benefits' in content:
             # Convert to bullet points
-            content = re.sub(r'(\d+\.\s+)', r'* ', content)
+            content = _NUM_DOT.sub(r'* ', content)
         
         # Add conclusion if missing
-        if not re.search(r'conclusion|summary|final', content, re.IGNORECASE):
+        if not _CONCLUSION.search(content):
             content += "\n\n## Summary\nThis comprehensive guide provides valuable insights and practical advice."
         
         return content
@@ -346,6 +625,16 @@ class SEOOptimizer:
     
     def get_suggestions(self, content: str, keywords: List[str]) -> List[str]:
         """Get SEO improvement suggestions"""
+        key = _result_key(content, keywords)
+        with self._cache_lock:
+            suggestions = self._suggestion_cache.get(key)
+        if suggestions is None:
+            suggestions = self._compute_suggestions(content, keywords)
+            with self._cache_lock:
+                self._suggestion_cache[key] = suggestions
+        return list(suggestions)
+    
+    def _compute_suggestions(self, content: str, keywords: List[str]) -> List[str]:
         suggestions = []
         
         # Check keyword density
@@ -356,26 +645,42 @@ class SEOOptimizer:
             elif data["density"] > self.seo_rules["keyword_density"]["max"]:
                 suggestions.append(f"High keyword density for '{keyword}' - reduce keyword stuffing")
         
+        # One pass for title, headings, meta description and links; stop once nothing can change
+        found = set()
+        link_count = 0
+        for match in _SUGGEST_PROBE.finditer(content):
+            kind = match.lastgroup
+            if kind == "link":
+                link_count += 1
+            else:
+                found.add(kind)
+            if link_count >= 2 and len(found) == 3:
+                break
+        
         # Check title
-        if not re.search(r'<h1[^>]*>|^#\s+', content, re.IGNORECASE):
+        if "h1" not in found:
             suggestions.append("Missing H1 title - add a compelling title with target keywords")
         
         # Check headings
-        if not re.search(r'<h2[^>]*>|^##\s+', content, re.IGNORECASE):
+        if "h2" not in found:
             suggestions.append("Missing H2 headings - add subheadings to improve structure")
         
         # Check content length
-        word_count = len(content.split())
+        word_count, _ = _tokenize(content)
         if word_count < self.seo_rules["content_length"]["min"]:
             suggestions.append("Content is too short - expand to provide more value")
         
         # Check meta description
-        if not re.search(r'<meta[^>]*name=["\']description["\']', content, re.IGNORECASE):
+        if "meta" not in found:
             suggestions.append("Missing meta description - add for better search results")
         
         # Check internal links
-        link_count = len(re.findall(r'<a[^>]*href=["\']([^"\']*)["\']', content))
         if link_count < 2:
             suggestions.append("Add more internal links to improve site structure")
         
-        return suggestions 
\ No newline at end of file
+        return suggestions 
+
+@lru_cache(maxsize=1)
+def get_seo_optimizer() -> SEOOptimizer:
+    """Process-wide shared SEOOptimizer, built on first use"""
+    return SEOOptimizer()
\ No newline at end of file
@@ -1,7 +1,12 @@
 import asyncio
+import hashlib
 import logging
 import re
-from typing import List, Tuple, Dict
+import threading
+from collections import Counter
+from functools import lru_cache
+from typing import List, Tuple, Dict, Optional
+from cachetools import LRUCache
 # SpaCy import is optional - will use basic text processing if not available
 try:
     import spacy
@@ -14,26 +19,207 @@ try:
     TEXTSTAT_AVAILABLE = True
 except ImportError:
     TEXTSTAT_AVAILABLE = False
+# PyArrow import is optional - refine_batch swaps words document by document without it
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+# The Numba polish kernel is optional - needs numba and numpy, compiled at import
+try:
+    from ._polish_numba import polish as _polish_ascii
+    POLISH_NUMBA_AVAILABLE = True
+except ImportError:
+    POLISH_NUMBA_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# Vocabulary swaps per target audience
+AUDIENCE_ADJUSTMENTS = {
+    "general": [],
+    "technical": [
+        ("simple", "straightforward"),
+        ("easy", "efficient"),
+        ("basic", "fundamental")
+    ],
+    "beginners": [
+        ("complex", "detailed"),
+        ("advanced", "comprehensive"),
+        ("sophisticated", "thorough")
+    ],
+    "experts": [
+        ("simple", "elementary"),
+        ("basic", "fundamental"),
+        ("easy", "straightforward")
+    ]
+}
+
+def _split_sentences(content: str) -> List[str]:
+    """Split content on '. ' into the sentence list the refinement stages work on"""
+    return content.split('. ')
+
+def _join_sentences(sentences: List[str]) -> str:
+    """Inverse of _split_sentences for sentences that don't themselves contain '. '"""
+    return '. '.join(sentences)
+
+def _polish(content: str) -> str:
+    """
+    Collapse whitespace, drop whitespace before punctuation and capitalize sentences in one scan
+    
+    Same result as collapsing whitespace runs to a space, removing the space before [.,!?],
+    then splitting on '. ', dropping empty sentences and capitalizing the rest.
+    """
+    out = []
+    append = out.append
+    pending_space = False  # whitespace seen but not yet emitted
+    start = True           # next emitted character begins a sentence
+    last = ''
+    
+    for ch in content:
+        if ch.isspace():
+            pending_space = True
+            continue
+        if pending_space:
+            pending_space = False
+            if ch not in '.,!?':
+                if last != '.':
+                    append(' ')
+                    start = False
+                elif len(out) == 1:
+                    # Text opened with '. ': the empty first sentence is dropped
+                    out.clear()
+                    start = True
+                else:
+                    append(' ')
+                    start = True
+        if start:
+            ch = ch.upper()
+            start = False
+        append(ch)
+        last = ch
+    
+    if pending_space:
+        if last == '.':
+            # Text closed with '. ': the empty last sentence and its separator are dropped
+            out.pop()
+        else:
+            append(' ')
+    
+    return ''.join(out)
+
+# Below this many characters the Python scan beats encoding for the JIT kernel
+POLISH_NUMBA_MIN_CHARS = 32
+
+def _compile_replacements(pairs: List[Tuple[str, str]]):
+    """
+    One whole-word, case-insensitive alternation over every old word, a named group per pair
+    
+    When a pair's old word contains a later pair's old word (academic "also" / "so"),
+    replacing the first can remove the substring the later pair's check looks for,
+    so those tables get a list of per-word patterns to apply one by one instead.
+    """
+    if not pairs:
+        return None
+    for index, (old_word, _) in enumerate(pairs):
+        if any(later in old_word for later, _ in pairs[index + 1:]):
+            return [re.compile(rf'\b{old_word}\b', re.IGNORECASE) for old_word, _ in pairs]
+    return re.compile(
+        '|'.join(rf'(?P<w{index}>\b{old_word}\b)' for index, (old_word, _) in enumerate(pairs)),
+        re.IGNORECASE
+    )
+
+def _replace_words(content: str, pairs: List[Tuple[str, str]], pattern) -> Tuple[str, List[Tuple[str, str]]]:
+    """
+    Apply the (old_word, new_word) pairs whose old word occurs in the lowercased content
+    
+    With a combined pattern this is a single pass over the content; no replacement
+    produces another pair's old word, so it gives the same text as replacing word
+    by word. Returns the applied pairs.
+    """
+    if isinstance(pattern, list):
+        applied_pairs = []
+        for (old_word, new_word), word_pattern in zip(pairs, pattern):
+            if old_word in content.lower():
+                content = word_pattern.sub(new_word, content)
+                applied_pairs.append((old_word, new_word))
+        return content, applied_pairs
+    
+    content_lower = content.lower()
+    applied = [old_word in content_lower for old_word, _ in pairs]
+    if not any(applied):
+        return content, []
+    
+    def substitute(match):
+        index = int(match.lastgroup[1:])
+        return pairs[index][1] if applied[index] else match.group(0)
+    
+    content = pattern.sub(substitute, content)
+    return content, [pair for pair, used in zip(pairs, applied) if used]
+
+# Below this many documents the per-call Arrow overhead outweighs the vectorized kernels
+ARROW_MIN_BATCH = 8
+
+def _replace_words_batch(
+    contents: List[str], pairs: List[Tuple[str, str]], pattern
+) -> Tuple[List[str], List[List[Tuple[str, str]]]]:
+    """
+    _replace_words over many ASCII documents with one Arrow regex kernel call per pair
+    
+    Arrow runs RE2, whose word boundaries are ASCII-only, so callers pass ASCII text only.
+    The presence checks follow _replace_words: against the original text for a
+    combined pattern, against the text so far for per-word patterns.
+    """
+    applied_pairs = [[] for _ in contents]
+    if pattern is None:
+        return list(contents), applied_pairs
+    
+    arr = pa.array(contents, type=pa.string())
+    sequential = isinstance(pattern, list)
+    lower = pc.ascii_lower(arr)
+    for old_word, new_word in pairs:
+        if sequential:
+            lower = pc.ascii_lower(arr)
+        present = pc.match_substring(lower, old_word)
+        if not pc.any(present).as_py():
+            continue
+        for index, used in enumerate(present.to_pylist()):
+            if used:
+                applied_pairs[index].append((old_word, new_word))
+        arr = pc.replace_substring_regex(arr, pattern=rf'(?i)\b{old_word}\b', replacement=new_word)
+    
+    return arr.to_pylist(), applied_pairs
+
+# Pipeline components the refiner never uses; only sentence segmentation is kept
+SPACY_EXCLUDE = ["tok2vec", "tagger", "parser", "attribute_ruler", "lemmatizer", "ner"]
+
+@lru_cache(maxsize=None)
+def get_spacy_model():
+    """Shared en_core_web_sm pipeline with just the senter component, loaded on first use"""
+    if not SPACY_AVAILABLE:
+        logger.warning("SpaCy not available. Using basic text processing.")
+        return None
+    try:
+        return spacy.load("en_core_web_sm", exclude=SPACY_EXCLUDE, enable=["senter"])
+    except OSError:
+        logger.warning("spaCy model not found. Using basic text processing.")
+        return None
+
+# Refinement results keyed by (content digest, style, length, audience); shared by all StyleRefiner instances
+REFINE_CACHE_SIZE = 1024
+_refine_cache = LRUCache(maxsize=REFINE_CACHE_SIZE)
+_refine_cache_lock = threading.Lock()
+refine_cache_stats = Counter()
+
+def _refine_key(content: str, style: str, length: str, target_audience: str) -> tuple:
+    return (hashlib.blake2b(content.encode("utf-8", "surrogatepass"), digest_size=16).digest(), style, length, target_audience)
+
 class StyleRefiner:
     """
     Style & Tone Refinement Agent - Adjusts content style and tone based on user preferences
     """
     
     def __init__(self):
-        # Load spaCy model for text processing
-        if SPACY_AVAILABLE:
-            try:
-                self.nlp = spacy.load("en_core_web_sm")
-            except OSError:
-                logger.warning("spaCy model not found. Using basic text processing.")
-                self.nlp = None
-        else:
-            logger.warning("SpaCy not available. Using basic text processing.")
-            self.nlp = None
-        
         # Define style transformation rules
         self.style_rules = {
             "professional": {
@@ -68,6 +254,21 @@ class StyleRefiner:
             "medium": {"target_ratio": 1.0, "max_sentences": 6},
             "long": {"target_ratio": 1.5, "max_sentences": 10}
         }
+        
+        # Word-replacement alternations compiled once instead of on every refine() call
+        self._style_patterns = {
+            style: _compile_replacements(self._get_word_replacements(style))
+            for style in self.style_rules
+        }
+        self._audience_patterns = {
+            audience: _compile_replacements(pairs)
+            for audience, pairs in AUDIENCE_ADJUSTMENTS.items()
+        }
+    
+    @property
+    def nlp(self):
+        """spaCy pipeline for text processing, or None; loaded once per process on first access"""
+        return get_spacy_model()
     
     async def refine(
         self, 
@@ -89,43 +290,143 @@ class StyleRefiner:
             Tuple of (refined_content, changes_made)
         """
         try:
-            changes = []
-            refined_content = content
-            
-            # Apply style transformations
-            refined_content, style_changes = self._apply_style_transformations(
-                refined_content, style, target_audience
-            )
-            changes.extend(style_changes)
+            key = _refine_key(content, style, length, target_audience)
+            with _refine_cache_lock:
+                cached = _refine_cache.get(key)
+            if cached is not None:
+                refine_cache_stats["hits"] += 1
+                refined_content, changes = cached
+                return refined_content, list(changes)
             
-            # Apply length adjustments
-            refined_content, length_changes = self._adjust_length(
-                refined_content, length
+            refine_cache_stats["misses"] += 1
+            # CPU-bound; run on a worker thread so the event loop keeps serving other requests
+            refined_content, changes = await asyncio.to_thread(
+                self._refine_sync, content, style, length, target_audience
             )
-            changes.extend(length_changes)
-            
-            # Apply audience-specific adjustments
-            refined_content, audience_changes = self._adjust_for_audience(
-                refined_content, target_audience
-            )
-            changes.extend(audience_changes)
-            
-            # Final polish
-            refined_content = self._polish_content(refined_content)
-            
+            with _refine_cache_lock:
+                _refine_cache[key] = (refined_content, tuple(changes))
             return refined_content, changes
             
         except Exception as e:
             logger.error(f"Content refinement failed: {e}")
             return content, [f"Refinement failed: {str(e)}"]
     
-    def _apply_style_transformations(
+    async def refine_batch(
         self, 
-        content: str, 
+        contents: List[str], 
+        style: str = "casual",
+        length: str = "medium",
+        target_audience: str = "general"
+    ) -> List[Tuple[str, List[str]]]:
+        """
+        Refine many documents with the same style, length and audience preferences
+        
+        Returns:
+            One (refined_content, changes_made) tuple per document, in order
+        """
+        return await asyncio.to_thread(self._refine_batch_sync, contents, style, length, target_audience)
+    
+    def _refine_batch_sync(
+        self, 
+        contents: List[str], 
         style: str, 
+        length: str, 
         target_audience: str
+    ) -> List[Tuple[str, List[str]]]:
+        """Cached documents come straight back; the rest share one Arrow pass for the style word swaps"""
+        results = [None] * len(contents)
+        keys = [_refine_key(content, style, length, target_audience) for content in contents]
+        with _refine_cache_lock:
+            for index, key in enumerate(keys):
+                cached = _refine_cache.get(key)
+                if cached is not None:
+                    results[index] = (cached[0], list(cached[1]))
+        
+        misses = [index for index, result in enumerate(results) if result is None]
+        refine_cache_stats["hits"] += len(contents) - len(misses)
+        refine_cache_stats["misses"] += len(misses)
+        
+        swapped = {}
+        batchable = [index for index in misses if contents[index].isascii()]
+        if PYARROW_AVAILABLE and len(batchable) >= ARROW_MIN_BATCH:
+            word_style = style if style in self.style_rules else "casual"
+            try:
+                texts, applied_pairs = _replace_words_batch(
+                    [contents[index] for index in batchable],
+                    self._get_word_replacements(word_style),
+                    self._style_patterns[word_style]
+                )
+                swapped = {index: pair for index, pair in zip(batchable, zip(texts, applied_pairs))}
+            except Exception as e:
+                logger.warning(f"Batched word replacement failed, swapping per document: {e}")
+        
+        for index in misses:
+            content = contents[index]
+            try:
+                refined_content, changes = self._refine_sync(
+                    content, style, length, target_audience, swapped.get(index)
+                )
+            except Exception as e:
+                logger.error(f"Content refinement failed: {e}")
+                results[index] = (content, [f"Refinement failed: {str(e)}"])
+                continue
+            with _refine_cache_lock:
+                _refine_cache[keys[index]] = (refined_content, tuple(changes))
+            results[index] = (refined_content, changes)
+        
+        return results
+    
+    def _refine_sync(
+        self, 
+        content: str, 
+        style: str, 
+        length: str, 
+        target_audience: str,
+        swapped: Optional[Tuple[str, List[Tuple[str, str]]]] = None
     ) -> Tuple[str, List[str]]:
-        """Apply style-specific transformations to content"""
+        """
+        Run every refinement step; pure, so refine() caches its results
+        
+        The content is split into sentences once after the style word swaps; the
+        sentence-level stages pass that list along and it is joined once before
+        the audience swaps and the final polish, which work on the whole text.
+        swapped carries (content, applied pairs) when refine_batch already did the
+        style word swaps.
+        """
+        changes = []
+        
+        # Apply style transformations
+        sentences, style_changes = self._apply_style_transformations(
+            content, style, target_audience, swapped
+        )
+        changes.extend(style_changes)
+        
+        # Apply length adjustments
+        sentences, length_changes = self._adjust_length(
+            sentences, length
+        )
+        changes.extend(length_changes)
+        refined_content = _join_sentences(sentences)
+        
+        # Apply audience-specific adjustments
+        refined_content, audience_changes = self._adjust_for_audience(
+            refined_content, target_audience
+        )
+        changes.extend(audience_changes)
+        
+        # Final polish
+        refined_content = self._polish_content(refined_content)
+        
+        return refined_content, changes
+    
+    def _apply_style_transformations(
+        self, 
+        content: str, 
+        style: str, 
+        target_audience: str,
+        swapped: Optional[Tuple[str, List[Tuple[str, str]]]] = None
+    ) -> Tuple[List[str], List[str]]:
+        """Apply style-specific transformations to content, returning it split into sentences"""
         changes = []
         
         if style not in self.style_rules:
@@ -134,24 +435,28 @@ class StyleRefiner:
         rules = self.style_rules[style]
         
         # Apply word replacements
-        for old_word, new_word in self._get_word_replacements(style):
-            if old_word in content.lower():
-                content = re.sub(rf'\b{old_word}\b', new_word, content, flags=re.IGNORECASE)
-                changes.append(f"Replaced '{old_word}' with '{new_word}' for {style} style")
+        if swapped is None:
+            content, replaced = _replace_words(content, self._get_word_replacements(style), self._style_patterns[style])
+        else:
+            content, replaced = swapped
+        for old_word, new_word in replaced:
+            changes.append(f"Replaced '{old_word}' with '{new_word}' for {style} style")
+        
+        sentences = _split_sentences(content)
         
         # Adjust sentence structure
         if rules["sentence_structure"] == "simple":
-            content = self._simplify_sentences(content)
+            sentences = self._simplify_sentences(sentences)
             changes.append("Simplified sentence structure for better readability")
         elif rules["sentence_structure"] == "complex":
-            content = self._complexify_sentences(content)
+            sentences = self._complexify_sentences(sentences)
             changes.append("Enhanced sentence complexity for professional tone")
         
         # Adjust tone markers
-        content = self._adjust_tone_markers(content, style)
+        sentences = self._adjust_tone_markers(sentences, style)
         changes.append(f"Applied {style} tone markers")
         
-        return content, changes
+        return sentences, changes
     
     def _get_word_replacements(self, style: str) -> List[Tuple[str, str]]:
         """Get word replacement pairs for specific style"""
@@ -192,9 +497,8 @@ class StyleRefiner:
         
         return replacements.get(style, [])
     
-    def _simplify_sentences(self, content: str) -> str:
+    def _simplify_sentences(self, sentences: List[str]) -> List[str]:
         """Simplify complex sentences"""
-        sentences = content.split('. ')
         simplified_sentences = []
         
         for sentence in sentences:
@@ -208,11 +512,11 @@ class StyleRefiner:
             else:
                 simplified_sentences.append(sentence)
         
-        return '. '.join(simplified_sentences)
+        return simplified_sentences
     
-    def _complexify_sentences(self, content: str) -> str:
+    def _complexify_sentences(self, sentences: List[str]) -> List[str]:
         """Make sentences more complex for professional tone"""
-        sentences = content.split('. ')
+        sentences = list(sentences)
         complex_sentences = []
         
         for i, sentence in enumerate(sentences):
@@ -227,9 +531,10 @@ class StyleRefiner:
             else:
                 complex_sentences.append(sentence)
         
-        return '. '.join([s for s in complex_sentences if s])
+        # Empty text still counts as one (empty) sentence, as it does after a split
+        return [s for s in complex_sentences if s] or ['']
     
-    def _adjust_tone_markers(self, content: str, style: str) -> str:
+    def _adjust_tone_markers(self, sentences: List[str], style: str) -> List[str]:
         """Add tone-specific markers to content"""
         markers = {
             "professional": [
@@ -259,19 +564,20 @@ class StyleRefiner:
         }
         
         if style in markers:
-            # Add markers at strategic points
-            sentences = content.split('. ')
+            # Add markers at strategic points; a marker ending in '.' adds a sentence
+            # break, so the marked sentences are split again to keep the list in step
+            sentences = list(sentences)
             if len(sentences) > 2:
                 # Add marker to second sentence
-                sentences[1] = f"{markers[style][0]} {sentences[1].lower()}"
+                sentences[1:2] = _split_sentences(f"{markers[style][0]} {sentences[1].lower()}")
             
             # Add conclusion marker
             if len(sentences) > 1:
-                sentences[-1] = f"{markers[style][-1]} {sentences[-1]}"
+                sentences[-1:] = _split_sentences(f"{markers[style][-1]} {sentences[-1]}")
         
-        return '. '.join(sentences)
+        return sentences
     
-    def _adjust_length(self, content: str, length: str) -> Tuple[str, List[str]]:
+    def _adjust_length(self, sentences: List[str], length: str) -> Tuple[List[str], List[str]]:
         """Adjust content length based on target"""
         changes = []
         
@@ -279,22 +585,21 @@ class StyleRefiner:
             length = "medium"
         
         rules = self.length_rules[length]
-        current_sentences = len(content.split('. '))
+        current_sentences = len(sentences)
         target_sentences = rules["max_sentences"]
         
         if current_sentences > target_sentences:
             # Shorten content
-            sentences = content.split('. ')
-            content = '. '.join(sentences[:target_sentences])
+            sentences = sentences[:target_sentences]
             changes.append(f"Shortened content to {target_sentences} sentences")
         elif current_sentences < target_sentences * 0.7:
             # Expand content
-            content = self._expand_content(content, target_sentences - current_sentences)
+            sentences = self._expand_content(sentences, target_sentences - current_sentences)
             changes.append(f"Expanded content to meet {length} length requirements")
         
-        return content, changes
+        return sentences, changes
     
-    def _expand_content(self, content: str, additional_sentences: int) -> str:
+    def _expand_content(self, sentences: List[str], additional_sentences: int) -> List[str]:
         """Expand content by adding relevant sentences"""
         expansion_templates = [
             "This aspect is particularly important to consider.",
@@ -307,60 +612,30 @@ class StyleRefiner:
             "This method has demonstrated consistent results."
         ]
         
-        sentences = content.split('. ')
+        sentences = list(sentences)
         for i in range(additional_sentences):
             if i < len(expansion_templates):
                 sentences.append(expansion_templates[i])
         
-        return '. '.join(sentences)
+        return sentences
     
     def _adjust_for_audience(self, content: str, target_audience: str) -> Tuple[str, List[str]]:
         """Adjust content for specific target audience"""
         changes = []
         
-        audience_adjustments = {
-            "general": [],
-            "technical": [
-                ("simple", "straightforward"),
-                ("easy", "efficient"),
-                ("basic", "fundamental")
-            ],
-            "beginners": [
-                ("complex", "detailed"),
-                ("advanced", "comprehensive"),
-                ("sophisticated", "thorough")
-            ],
-            "experts": [
-                ("simple", "elementary"),
-                ("basic", "fundamental"),
-                ("easy", "straightforward")
-            ]
-        }
-        
-        if target_audience in audience_adjustments:
-            for old_word, new_word in audience_adjustments[target_audience]:
-                if old_word in content.lower():
-                    content = re.sub(rf'\b{old_word}\b', new_word, content, flags=re.IGNORECASE)
-                    changes.append(f"Adjusted vocabulary for {target_audience} audience")
+        if target_audience in self._audience_patterns and AUDIENCE_ADJUSTMENTS[target_audience]:
+            content, adjusted = _replace_words(
+                content, AUDIENCE_ADJUSTMENTS[target_audience], self._audience_patterns[target_audience]
+            )
+            changes.extend(f"Adjusted vocabulary for {target_audience} audience" for _ in adjusted)
         
         return content, changes
     
     def _polish_content(self, content: str) -> str:
         """Final polish of the content"""
-        # Remove extra whitespace
-        content = re.sub(r'\s+', ' ', content)
-        
-        # Fix punctuation
-        content = re.sub(r'\s+([.,!?])', r'\1', content)
-        
-        # Ensure proper capitalization
-        sentences = content.split('. ')
-        capitalized_sentences = []
-        for sentence in sentences:
-            if sentence:
-                capitalized_sentences.append(sentence[0].upper() + sentence[1:])
-        
-        return '. '.join(capitalized_sentences)
+        if POLISH_NUMBA_AVAILABLE and len(content) >= POLISH_NUMBA_MIN_CHARS and content.isascii():
+            return _polish_ascii(content)
+        return _polish(content)
     
     def calculate_readability(self, content: str) -> float:
         """Calculate readability score using Flesch Reading Ease"""
@@ -372,4 +647,9 @@ class StyleRefiner:
             return textstat.flesch_reading_ease(content)
         except Exception as e:
             logger.error(f"Readability calculation failed: {e}")
-            return 60.0  # Default score 
\ No newline at end of file
+            return 60.0  # Default score 
+
+@lru_cache(maxsize=1)
+def get_style_refiner() -> StyleRefiner:
+    """Process-wide shared StyleRefiner, built on first use"""
+    return StyleRefiner()
\ No newline at end of file
@@ -39,20 +39,29 @@ except Exception as e:
 
 print("\n🚀 Starting FastAPI application...")
 
-from fastapi import FastAPI, HTTPException, Depends, status
+from fastapi import FastAPI, HTTPException, Depends, status, UploadFile, File
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from pydantic import BaseModel
 from typing import List, Optional, Dict, Any
 import uvicorn
+import orjson
 from sqlalchemy.orm import Session
 from datetime import datetime
-
-# Import our content creation modules
-from core.content_generator import ContentGenerator
-from core.style_refiner import StyleRefiner
-from core.seo_optimizer import SEOOptimizer
-from core.plagiarism_checker import PlagiarismChecker
+import asyncio
+import atexit
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+# Import our content creation modules; each agent is built on first use by its
+# get_* factory, so endpoints that don't need an agent never pay for constructing it
+from core.content_generator import get_content_generator, provider_health
+from core.style_refiner import get_style_refiner
+from core.seo_optimizer import get_seo_optimizer
+from core.plagiarism_checker import get_plagiarism_checker
+from core.model import predict_image
 
 # Import database and auth modules
 from models.database import get_db, engine, Base
@@ -61,6 +70,14 @@ from models.user import User
 from models.content import Content
 from auth.dependencies import get_current_user
 
+# Hand log records to a background listener so handler I/O stays off the request path
+_log_queue = queue.SimpleQueue()
+_root_logger = logging.getLogger()
+_log_listener = QueueListener(_log_queue, *(_root_logger.handlers or [logging.StreamHandler()]), respect_handler_level=True)
+_root_logger.handlers = [QueueHandler(_log_queue)]
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
 app = FastAPI(
     title="AI Content Creation Platform",
     version="1.0.0"
@@ -78,11 +95,14 @@ app.add_middleware(
 # Create database tables
 Base.metadata.create_all(bind=engine)
 
-# Initialize our agents
-content_generator = ContentGenerator()
-style_refiner = StyleRefiner()
-seo_optimizer = SEOOptimizer()
-plagiarism_checker = PlagiarismChecker()
+@app.on_event("startup")
+async def warm_provider_connections():
+    # Runs in the background so startup does not wait on provider round-trips
+    asyncio.create_task(get_content_generator().warmup())
+
+@app.on_event("shutdown")
+async def close_provider_connections():
+    await get_content_generator().aclose()
 
 # Pydantic models for API requests/responses
 class ContentGenerationRequest(BaseModel):
@@ -109,6 +129,15 @@ class ContentRefinementResponse(BaseModel):
     changes_made: List[str]
     readability_score: float
 
+class ContentRefinementBatchRequest(BaseModel):
+    contents: List[str]
+    style: str = "casual"
+    length: str = "medium"
+    target_audience: str = "general"
+
+class ContentRefinementBatchResponse(BaseModel):
+    results: List[ContentRefinementResponse]
+
 class SEOOptimizationRequest(BaseModel):
     content: str
     keywords: List[str]
@@ -176,7 +205,8 @@ def health_check():
     return {
         "status": "AI-Assisted Content Creation Platform API is running.",
         "version": "1.0.0",
-        "agents": ["content_generator", "style_refiner", "seo_optimizer", "plagiarism_checker"]
+        "agents": ["content_generator", "style_refiner", "seo_optimizer", "plagiarism_checker"],
+        "providers": provider_health()
     }
 
 # Authentication endpoints
@@ -288,9 +318,6 @@ async def generate_content(
         word_count = request.word_count
         keywords = request.keywords
         
-        # Initialize content generator
-        content_generator = ContentGenerator()
-        
         # Create a comprehensive prompt
         prompt = f"""
         Title: {title}
@@ -305,7 +332,7 @@ async def generate_content(
         """
         
         # Generate content using AI
-        result = await content_generator.generate_content(
+        result = await get_content_generator().generate_content(
             prompt=prompt,
             content_type=content_type,
             style=tone,
@@ -376,7 +403,7 @@ async def get_content(
 async def generate_advanced_content(request: ContentGenerationRequest):
     """Generate content using advanced parameters"""
     try:
-        result = await content_generator.generate_content(
+        result = await get_content_generator().generate_content(
             prompt=request.prompt,
             content_type=request.content_type,
             style=request.tone,
@@ -400,30 +427,75 @@ async def generate_advanced_content(request: ContentGenerationRequest):
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/api/v1/content/generate-stream")
+async def stream_content(request: ContentGenerationRequest):
+    """Stream generated content as server-sent events"""
+    async def event_stream():
+        async for event in get_content_generator().generate_content_stream(
+            prompt=request.prompt,
+            content_type=request.content_type,
+            style=request.tone,
+            length="long" if request.word_count > 1000 else "medium" if request.word_count > 500 else "short"
+        ):
+            yield b"data: " + orjson.dumps(event) + b"\n\n"
+    
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
 @app.post("/api/v1/content/refine", response_model=ContentRefinementResponse)
 async def refine_content(request: ContentRefinementRequest):
     """Refine existing content"""
     try:
-        result = await style_refiner.refine_content(
+        style_refiner = get_style_refiner()
+        # Both steps are CPU-bound and run off the event loop
+        refined_content, changes_made = await style_refiner.refine(
             content=request.content,
             style=request.style,
+            length=request.length,
             target_audience=request.target_audience
         )
+        readability_score = await asyncio.to_thread(style_refiner.calculate_readability, refined_content)
         
         return ContentRefinementResponse(
-            refined_content=result["refined_content"],
-            changes_made=result["changes_made"],
-            readability_score=result["readability_score"]
+            refined_content=refined_content,
+            changes_made=changes_made,
+            readability_score=readability_score
         )
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/api/v1/content/refine-batch", response_model=ContentRefinementBatchResponse)
+async def refine_content_batch(request: ContentRefinementBatchRequest):
+    """Refine many documents with the same preferences"""
+    try:
+        style_refiner = get_style_refiner()
+        results = await style_refiner.refine_batch(
+            contents=request.contents,
+            style=request.style,
+            length=request.length,
+            target_audience=request.target_audience
+        )
+        readability_scores = await asyncio.to_thread(
+            lambda: [style_refiner.calculate_readability(refined_content) for refined_content, _ in results]
+        )
+        
+        return ContentRefinementBatchResponse(results=[
+            ContentRefinementResponse(
+                refined_content=refined_content,
+                changes_made=changes_made,
+                readability_score=readability_score
+            )
+            for (refined_content, changes_made), readability_score in zip(results, readability_scores)
+        ])
+        
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
 @app.post("/api/v1/content/optimize-seo", response_model=SEOOptimizationResponse)
 async def optimize_seo(request: SEOOptimizationRequest):
     """Optimize content for SEO"""
     try:
-        result = await seo_optimizer.optimize_content(
+        result = await get_seo_optimizer().optimize_content(
             content=request.content,
             keywords=request.keywords,
             target_url=request.target_url
@@ -443,7 +515,7 @@ async def optimize_seo(request: SEOOptimizationRequest):
 async def check_plagiarism(request: PlagiarismCheckRequest):
     """Check content for plagiarism"""
     try:
-        result = await plagiarism_checker.check_content(
+        result = await get_plagiarism_checker().check_content(
             content=request.content,
             check_facts=request.check_facts
         )
@@ -458,5 +530,15 @@ async def check_plagiarism(request: PlagiarismCheckRequest):
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/predict")
+async def predict(image: UploadFile = File(...)):
+    """Classify an uploaded image sent as multipart form data"""
+    try:
+        image_bytes = await image.read()
+        return {"prediction": predict_image(image_bytes)}
+
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
 if __name__ == "__main__":
     uvicorn.run(app, host="0.0.0.0", port=8000)
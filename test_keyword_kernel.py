@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Keyword Kernel Test - Checks every keyword-count path against str.count
+"""
+
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from backend.core import seo_optimizer
+from backend.core.seo_optimizer import _keyword_counts, NUMBA_AVAILABLE
+
+CASES = [
+    ("aaaa aaa", ["a", "aa", "aaa"]),
+    ("banana bandana", ["ana", "an", "nan", "banana"]),
+    ("abcabcab", ["ab", "abc", "bca", "cab"]),
+    ("café caf cafe café naïve", ["café", "caf", "é", "naïve", "e"]),
+    ("über straße über über", ["über", "ü", "straße", "ss"]),
+    ("🚀🚀🚀 rocket 🚀", ["🚀", "🚀🚀", "rocket"]),
+    ("日本語の日本語テキスト", ["日本", "日本語", "語の"]),
+    ("no keywords here", ["missing", "absent"]),
+    ("", ["empty"]),
+]
+
+def _expected(content: str, keywords):
+    return {keyword: content.count(keyword) for keyword in set(keywords)}
+
+def _random_cases(count: int = 300, seed: int = 99):
+    rng = random.Random(seed)
+    alphabet = "abé🚀 "
+    cases = []
+    for _ in range(count):
+        content = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 40)))
+        keywords = ["".join(rng.choice(alphabet) for _ in range(rng.randint(1, 3))) for _ in range(4)]
+        cases.append((content, keywords))
+    return cases
+
+def test_kernel_matches_str_count():
+    """The numba kernel should count leftmost non-overlapping matches like str.count"""
+    print("🧪 Testing numba keyword kernel against str.count...")
+    if not NUMBA_AVAILABLE:
+        print("⚠️  numba not installed, skipping")
+        return
+    import numpy as np
+    for content, keywords in CASES + _random_cases():
+        distinct = tuple(sorted(set(keywords)))
+        buf = np.frombuffer(content.encode("utf-8", "surrogatepass"), dtype=np.uint8)
+        counts = seo_optimizer._count_keywords_kernel(buf, *seo_optimizer._keyword_arrays(distinct))
+        assert dict(zip(distinct, counts.tolist())) == _expected(content, keywords), (content, keywords)
+    print("✅ Numba kernel matches")
+
+def test_every_path_matches_str_count():
+    """Aho-Corasick, numba and regex paths of _keyword_counts should all agree with str.count"""
+    print("🧪 Testing _keyword_counts paths against str.count...")
+    saved = (seo_optimizer.AHOCORASICK_AVAILABLE, seo_optimizer.NUMBA_AVAILABLE, seo_optimizer.NUMBA_MIN_BYTES)
+    paths = {
+        "ahocorasick": (saved[0], False, saved[2]),
+        "numba": (False, saved[1], 0),
+        "regex": (False, False, saved[2]),
+    }
+    try:
+        for name, flags in paths.items():
+            (seo_optimizer.AHOCORASICK_AVAILABLE, seo_optimizer.NUMBA_AVAILABLE,
+             seo_optimizer.NUMBA_MIN_BYTES) = flags
+            for content, keywords in CASES + _random_cases():
+                assert _keyword_counts(content, keywords) == _expected(content, keywords), (name, content, keywords)
+            print(f"✅ {name} path matches")
+    finally:
+        (seo_optimizer.AHOCORASICK_AVAILABLE, seo_optimizer.NUMBA_AVAILABLE,
+         seo_optimizer.NUMBA_MIN_BYTES) = saved
+
+def main():
+    """Run keyword kernel tests"""
+    print("🚀 Keyword Kernel Test")
+    print("=" * 50)
+    test_kernel_matches_str_count()
+    test_every_path_matches_str_count()
+    print("\n🎉 Keyword kernel test passed!")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Polish Kernel Test - Checks the numba polish kernel against its pure-Python twin
+"""
+
+import os
+import random
+import re
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from backend.core import style_refiner
+from backend.core.style_refiner import StyleRefiner, _polish, POLISH_NUMBA_AVAILABLE
+
+# The whitespace / punctuation / sentence-split pipeline _polish replaced
+_WHITESPACE_RE = re.compile(r'\s+')
+_SPACE_BEFORE_PUNCT_RE = re.compile(r'\s+([.,!?])')
+
+def _reference(content: str) -> str:
+    content = _WHITESPACE_RE.sub(' ', content)
+    content = _SPACE_BEFORE_PUNCT_RE.sub(r'\1', content)
+    sentences = [s[0].upper() + s[1:] for s in content.split('. ') if s]
+    return '. '.join(sentences)
+
+EDGE_CASES = [
+    "",
+    " ",
+    ".",
+    ". ",
+    " . ",
+    ". hello world",
+    "hello world. ",
+    "hello world.  ",
+    ". . a. . ",
+    "hello , world ! how are you ? fine .",
+    "hello\t,\nworld\r\n.  next",
+    "a\x1cb\x1dc\x1ed\x1ff",
+    "end.\x1fstart. \x0bnext\x0c.",
+    "  many   spaces   here.   and   there  ",
+    "already. Capitalized. sentences.",
+    "1. 2. 3.",
+]
+
+def _random_cases(count: int = 2000, seed: int = 1234):
+    rng = random.Random(seed)
+    alphabet = "aZb. ,!?\t\n\x0b\x1c\x1f"
+    return ["".join(rng.choice(alphabet) for _ in range(rng.randint(0, 24))) for _ in range(count)]
+
+def test_python_polish_matches_reference():
+    """_polish should give the same result as the regex pipeline"""
+    print("🧪 Testing _polish against the regex pipeline...")
+    for case in EDGE_CASES + _random_cases() + ["café . über  ,  naïve.  ñu", "ß. ǆ. é .  x"]:
+        assert _polish(case) == _reference(case), repr(case)
+    print("✅ _polish matches")
+
+def test_numba_polish_matches_python():
+    """The numba kernel should give the same result as _polish on ASCII text"""
+    print("🧪 Testing numba polish kernel against _polish...")
+    if not POLISH_NUMBA_AVAILABLE:
+        print("⚠️  numba not installed, skipping")
+        return
+    for case in EDGE_CASES + _random_cases():
+        assert style_refiner._polish_ascii(case) == _polish(case), repr(case)
+    print("✅ Numba kernel matches")
+
+def test_polish_content_non_ascii():
+    """Non-ASCII text must take the Python path and still be polished"""
+    print("🧪 Testing _polish_content on non-ASCII text...")
+    refiner = StyleRefiner()
+    content = "première phrase ,  très longue .  deuxième phrase  ! ü" * 3
+    assert refiner._polish_content(content) == _reference(content)
+    ascii_content = "first sentence ,  quite long .  second sentence  ! end " * 3
+    assert refiner._polish_content(ascii_content) == _reference(ascii_content)
+    print("✅ _polish_content matches")
+
+def main():
+    """Run polish kernel tests"""
+    print("🚀 Polish Kernel Test")
+    print("=" * 50)
+    test_python_polish_matches_reference()
+    test_numba_polish_matches_python()
+    test_polish_content_non_ascii()
+    print("\n🎉 Polish kernel test passed!")
+
+if __name__ == "__main__":
+    main()